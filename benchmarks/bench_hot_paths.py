@@ -0,0 +1,212 @@
+"""
+Benchmarks for the palette generation, colourblindness simulation and rendering hot
+paths in distinctipy.
+
+Each benchmark reports its wall time (the best of a few repeats) and, for benchmarks
+that generate colours, the palette quality: the smallest color_distance between any
+generated colour and any other generated or excluded colour (larger is better). Both
+should be compared between releases to catch regressions in speed or quality.
+
+Nothing is downloaded, so the benchmarks can be run offline with:
+    python benchmarks/bench_hot_paths.py
+
+Use --quick to skip the slowest cases and --json to save the results to a file.
+"""
+import argparse
+import json
+import platform
+import time
+
+import numpy as np
+
+import distinctipy
+from distinctipy import colorblind
+from distinctipy.distinctipy import _min_pairwise_distance
+
+DEFAULT_EXCLUDE = [distinctipy.WHITE, distinctipy.BLACK]
+
+
+def timed(func, repeat=3):
+    """
+    Run func repeat times, returning the best wall time and the last result.
+    """
+    best = np.inf
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    return best, result
+
+
+def bench_get_colors(quick=False):
+    sizes = [10, 50, 200] if quick else [10, 50, 200, 1000]
+    for n_colors in sizes:
+        for incremental in (False, True):
+            repeat = 1 if n_colors >= 200 else 3
+            seconds, colors = timed(
+                lambda: distinctipy.get_colors(
+                    n_colors, incremental=incremental, rng=0
+                ),
+                repeat=repeat,
+            )
+            yield {
+                "name": "get_colors n={} incremental={}".format(n_colors, incremental),
+                "seconds": seconds,
+                "min_distance": _min_pairwise_distance(
+                    colors, exclude_colors=DEFAULT_EXCLUDE
+                ),
+            }
+
+
+def bench_get_colors_options(quick=False):
+    for colorblind_type in (None, "Deuteranomaly"):
+        for pastel_factor in (0.0, 0.7):
+            seconds, colors = timed(
+                lambda: distinctipy.get_colors(
+                    50,
+                    pastel_factor=pastel_factor,
+                    colorblind_type=colorblind_type,
+                    rng=0,
+                )
+            )
+            yield {
+                "name": "get_colors n=50 colorblind_type={} pastel_factor={}".format(
+                    colorblind_type, pastel_factor
+                ),
+                "seconds": seconds,
+                "min_distance": _min_pairwise_distance(
+                    colors, colorblind_type, exclude_colors=DEFAULT_EXCLUDE
+                ),
+            }
+
+
+def bench_distinct_color_large_exclude(quick=False):
+    sizes = [1000, 10000] if quick else [1000, 10000, 100000]
+    rng = np.random.default_rng(0)
+    for n_exclude in sizes:
+        exclude = [tuple(c) for c in rng.random((n_exclude, 3)).tolist()]
+        seconds, color = timed(lambda: distinctipy.distinct_color(exclude, rng=0))
+        yield {
+            "name": "distinct_color n_exclude={}".format(n_exclude),
+            "seconds": seconds,
+            "min_distance": _min_pairwise_distance([color], exclude_colors=exclude),
+        }
+
+
+def bench_colorblind_filter(quick=False):
+    colors = np.random.default_rng(0).random((10**5 if quick else 10**6, 3))
+    for colorblind_type in ("Deuteranomaly", "Tritanopia", "Achromatopsia"):
+        seconds, _ = timed(
+            lambda: colorblind.colorblind_filter(colors, colorblind_type)
+        )
+        yield {
+            "name": "colorblind_filter {} colors {}".format(
+                len(colors), colorblind_type
+            ),
+            "seconds": seconds,
+            "min_distance": None,
+        }
+
+
+def bench_simulate_image(quick=False):
+    shape = (540, 960, 3) if quick else (1080, 1920, 3)
+    image = (np.random.default_rng(0).random(shape) * 255).astype(np.uint8)
+    out = np.empty(shape, dtype=np.uint8)
+    for lut_size in (None, 33, 256):
+        if lut_size is not None:
+            # build the lookup table outside the timed region
+            colorblind.get_lut("Deuteranomaly", lut_size)
+        seconds, _ = timed(
+            lambda: colorblind.filter_image(
+                image, "Deuteranomaly", out=out, lut_size=lut_size
+            )
+        )
+        yield {
+            "name": "filter_image {}x{} lut_size={}".format(
+                shape[1], shape[0], lut_size
+            ),
+            "seconds": seconds,
+            "min_distance": None,
+        }
+
+
+def bench_color_swatch(quick=False):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return
+
+    colors = distinctipy.get_colors(200 if quick else 1000, incremental=True, rng=0)
+
+    def draw():
+        fig, ax = plt.subplots()
+        distinctipy.color_swatch(colors, ax=ax, show_text=True)
+        fig.canvas.draw()
+        plt.close(fig)
+
+    seconds, _ = timed(draw, repeat=1)
+    yield {
+        "name": "color_swatch {} colors".format(len(colors)),
+        "seconds": seconds,
+        "min_distance": None,
+    }
+
+
+BENCHMARKS = [
+    bench_get_colors,
+    bench_get_colors_options,
+    bench_distinct_color_large_exclude,
+    bench_colorblind_filter,
+    bench_simulate_image,
+    bench_color_swatch,
+]
+
+
+def run(quick=False, select=None):
+    results = []
+    print("{:<64} {:>10} {:>12}".format("benchmark", "time (s)", "min distance"))
+    for benchmark in BENCHMARKS:
+        if select and select not in benchmark.__name__:
+            continue
+        for result in benchmark(quick=quick):
+            distance = result["min_distance"]
+            print(
+                "{:<64} {:>10.4f} {:>12}".format(
+                    result["name"],
+                    result["seconds"],
+                    "-" if distance is None else "{:.4f}".format(distance),
+                )
+            )
+            results.append(result)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="skip the slowest cases")
+    parser.add_argument(
+        "--select", help="only run benchmarks whose function name contains this"
+    )
+    parser.add_argument("--json", help="save the results to this file")
+    args = parser.parse_args()
+
+    results = run(quick=args.quick, select=args.select)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "distinctipy": distinctipy.__version__,
+                    "python": platform.python_version(),
+                    "numpy": np.__version__,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
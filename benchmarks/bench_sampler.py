@@ -0,0 +1,58 @@
+"""
+Compare the quality of colours generated with each candidate sampler.
+
+For each sampler and number of candidates (n_attempts), generate several palettes
+with different seeds and report the mean and worst minimum pairwise color_distance
+between the generated colours (larger is better), and the mean time per palette.
+A non-zero pastel_factor is used by default so the pre-defined POINTS_OF_INTEREST,
+which are only tried when pastel_factor=0, don't mask the effect of the sampler.
+
+Run with:
+    python benchmarks/bench_sampler.py
+"""
+import argparse
+import time
+
+import numpy as np
+
+from distinctipy import distinctipy
+
+
+def run(
+    n_colors=20, pastel_factor=0.5, attempts=(25, 50, 100, 200, 500, 1000), n_seeds=10
+):
+    print(
+        "{:>8} {:>10} {:>12} {:>12} {:>10}".format(
+            "sampler", "n_attempts", "mean min d", "worst min d", "time (s)"
+        )
+    )
+    for n_attempts in attempts:
+        for sampler in ("random", "halton", "sobol"):
+            scores = []
+            start = time.perf_counter()
+            for seed in range(n_seeds):
+                colors = distinctipy.get_colors(
+                    n_colors,
+                    pastel_factor=pastel_factor,
+                    n_attempts=n_attempts,
+                    sampler=sampler,
+                    rng=seed,
+                )
+                scores.append(distinctipy._min_pairwise_distance(colors))
+            elapsed = (time.perf_counter() - start) / n_seeds
+
+            print(
+                "{:>8} {:>10} {:>12.4f} {:>12.4f} {:>10.4f}".format(
+                    sampler, n_attempts, np.mean(scores), np.min(scores), elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--n-colors", type=int, default=20)
+    parser.add_argument("--pastel-factor", type=float, default=0.5)
+    parser.add_argument("--n-seeds", type=int, default=10)
+    args = parser.parse_args()
+
+    run(n_colors=args.n_colors, pastel_factor=args.pastel_factor, n_seeds=args.n_seeds)
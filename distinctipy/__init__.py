@@ -9,10 +9,7 @@ Example:
     [(0, 1, 0), (1, 0, 1), (0, 0.5, 1), (1, 0.5, 0), (0.5, 0.75, 0.5)]
 """
 # flake8: noqa
-from importlib.metadata import version
-
 name = "distinctipy"
-__version__ = version(__name__)
 
 # Expose these module names and their internals in the top-level API
 __external__ = ["distinctipy"]
@@ -23,36 +20,115 @@ __protected__ = ["colorsets", "colorblind"]
 __autogen_notes__ = """
 # Autogenerate this init file
 pip install mkinit
-mkinit -m distinctipy --relative --black
+mkinit -m distinctipy --relative --black --lazy
 """
 
-# Everything after this point is autogenerate with mkinit
-from . import colorblind, colorsets, distinctipy, examples
-from .distinctipy import (
-    BLACK,
-    BLUE,
-    CORNERS,
-    CYAN,
-    GREEN,
-    INTERIOR,
-    MAGENTA,
-    MID_FACE,
-    POINTS_OF_INTEREST,
-    RED,
-    WHITE,
-    YELLOW,
-    color_distance,
-    color_swatch,
-    distinct_color,
-    get_colormap,
-    get_colors,
-    get_hex,
-    get_random_color,
-    get_rgb256,
-    get_text_color,
-    invert_colors,
+# Submodules and their attributes are imported on first access, so that importing
+# distinctipy stays cheap (set EAGER_IMPORT=1 to import everything up front).
+# __version__ is read from the package metadata on first access too.
+
+
+def lazy_import(module_name, submodules, submod_attrs):
+    import importlib
+    import os
+
+    name_to_submod = {
+        func: mod for mod, funcs in submod_attrs.items() for func in funcs
+    }
+
+    def __getattr__(name):
+        if name in submodules:
+            attr = importlib.import_module(
+                "{module_name}.{name}".format(module_name=module_name, name=name)
+            )
+        elif name in name_to_submod:
+            submodname = name_to_submod[name]
+            module = importlib.import_module(
+                "{module_name}.{submodname}".format(
+                    module_name=module_name, submodname=submodname
+                )
+            )
+            attr = getattr(module, name)
+        elif name == "__version__":
+            from importlib.metadata import version
+
+            attr = version(module_name)
+        else:
+            raise AttributeError(
+                "module {module_name!r} has no attribute {name!r}".format(
+                    module_name=module_name, name=name
+                )
+            )
+        globals()[name] = attr
+        return attr
+
+    if os.environ.get("EAGER_IMPORT", ""):
+        for name in submodules:
+            __getattr__(name)
+
+        for attrs in submod_attrs.values():
+            for attr in attrs:
+                __getattr__(attr)
+    return __getattr__
+
+
+__getattr__ = lazy_import(
+    __name__,
+    submodules={
+        "colorblind",
+        "colorsets",
+        "distinctipy",
+        "examples",
+    },
+    submod_attrs={
+        "distinctipy": [
+            "BLACK",
+            "BLUE",
+            "CORNERS",
+            "CYAN",
+            "GREEN",
+            "INTERIOR",
+            "MAGENTA",
+            "MID_FACE",
+            "POINTS_OF_INTEREST",
+            "PaletteBuilder",
+            "RED",
+            "WHITE",
+            "YELLOW",
+            "color_distance",
+            "color_distance_matrix",
+            "color_swatch",
+            "colorize_labels",
+            "distinct_color",
+            "get_colormap",
+            "get_colors",
+            "get_colors_batch",
+            "get_colors_cached",
+            "get_colors_large",
+            "get_colors_multistart",
+            "get_hex",
+            "get_random_color",
+            "get_rgb256",
+            "get_text_color",
+            "hex_to_rgb",
+            "invert_colors",
+            "iter_colors",
+            "refine_colors",
+            "rgb_to_hex",
+            "rgb_to_uint8",
+            "uint8_to_rgb",
+        ],
+        "examples": [
+            "compare_clusters",
+            "compare_colors",
+        ],
+    },
 )
-from .examples import compare_clusters, compare_colors
+
+
+def __dir__():
+    return __all__ + ["__version__"]
+
 
 __all__ = [
     "BLACK",
@@ -64,12 +140,15 @@ __all__ = [
     "MAGENTA",
     "MID_FACE",
     "POINTS_OF_INTEREST",
+    "PaletteBuilder",
     "RED",
     "WHITE",
     "YELLOW",
     "color_distance",
+    "color_distance_matrix",
     "color_swatch",
     "colorblind",
+    "colorize_labels",
     "colorsets",
     "compare_clusters",
     "compare_colors",
@@ -78,10 +157,20 @@ __all__ = [
     "examples",
     "get_colormap",
     "get_colors",
+    "get_colors_batch",
+    "get_colors_cached",
+    "get_colors_large",
+    "get_colors_multistart",
     "get_hex",
     "get_random_color",
     "get_rgb256",
     "get_text_color",
+    "hex_to_rgb",
     "invert_colors",
+    "iter_colors",
     "name",
+    "refine_colors",
+    "rgb_to_hex",
+    "rgb_to_uint8",
+    "uint8_to_rgb",
 ]
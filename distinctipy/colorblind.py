@@ -141,6 +141,83 @@ def blindMK(rgb, t):
     return z(s_r), z(s_g), z(s_b)
 
 
+def _anomylize_array(a, b):
+    """
+    Vectorised version of anomylize for (n, 3) arrays of colours.
+    """
+    v = 1.75
+    d = v * 1 + 1
+
+    return (v * b + a * 1) / d
+
+
+def _monochrome_array(rgb):
+    """
+    Vectorised version of monochrome for (n, 3) arrays of colours.
+    """
+    z = rgb[:, 0] * 0.299 + rgb[:, 1] * 0.587 + rgb[:, 2] * 0.114
+    return np.stack([z, z, z], axis=1)
+
+
+def _blindMK_array(rgb, t):
+    """
+    Vectorised version of blindMK for (n, 3) arrays of colours, replacing the scalar
+    branches with masked array operations. Gives the same results as blindMK applied
+    to each colour.
+    """
+    gamma = 2.2
+    wx = 0.312713
+    wy = 0.329016
+    wz = 0.358271
+
+    cpu = rBlind[t]["cpu"]
+    cpv = rBlind[t]["cpv"]
+    am = rBlind[t]["am"]
+    ayi = rBlind[t]["ayi"]
+
+    c_rgb = rgb**gamma
+    c_x, c_y, c_z = rgb2xyz(c_rgb.T)
+
+    sum_xyz = c_x + c_y + c_z
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nonzero = sum_xyz != 0
+        c_u = np.where(nonzero, c_x / sum_xyz, 0.0)
+        c_v = np.where(nonzero, c_y / sum_xyz, 0.0)
+
+        nx = wx * c_y / wy
+        nz = wz * c_y / wy
+
+        d_y = np.zeros_like(c_y)
+
+        clm = np.where(c_u < cpu, (cpv - c_v) / (cpu - c_u), (c_v - cpv) / (c_u - cpu))
+
+        clyi = c_v - c_u * clm
+        d_u = (ayi - clyi) / (clm - am)
+        d_v = (clm * d_u) + clyi
+
+        s_x = d_u * c_y / d_v
+        s_y = c_y
+        s_z = (1 - (d_u + d_v)) * c_y / d_v
+
+        s_rgb = np.stack(xyz2rgb((s_x, s_y, s_z)), axis=1)
+
+        d_x = nx - s_x
+        d_z = nz - s_z
+
+        d_rgb = np.stack(xyz2rgb((d_x, d_y, d_z)), axis=1)
+
+        const = np.where(s_rgb < 0, 0.0, 1.0)
+        adj = np.where(d_rgb != 0, (const - s_rgb) / d_rgb, 0.0)
+
+    adj = np.where((adj > 1) | (adj < 0), 0.0, adj)
+    adjust = adj.max(axis=1, keepdims=True)
+
+    s_rgb = s_rgb + (adjust * d_rgb)
+
+    return np.clip(s_rgb, 0.0, 1.0) ** (1 / gamma)
+
+
 fBlind = {
     "Normal": lambda v: v,
     "Protanopia": lambda v: blindMK(v, "protan"),
@@ -153,14 +230,66 @@ fBlind = {
     "Achromatomaly": lambda v: anomylize(v, monochrome(v)),
 }
 
+# versions of the fBlind filters operating on (n, 3) arrays of colours
+_fBlind_array = {
+    "Normal": lambda v: v.copy(),
+    "Protanopia": lambda v: _blindMK_array(v, "protan"),
+    "Protanomaly": lambda v: _anomylize_array(v, _blindMK_array(v, "protan")),
+    "Deuteranopia": lambda v: _blindMK_array(v, "deutan"),
+    "Deuteranomaly": lambda v: _anomylize_array(v, _blindMK_array(v, "deutan")),
+    "Tritanopia": lambda v: _blindMK_array(v, "tritan"),
+    "Tritanomaly": lambda v: _anomylize_array(v, _blindMK_array(v, "tritan")),
+    "Achromatopsia": lambda v: _monochrome_array(v),
+    "Achromatomaly": lambda v: _anomylize_array(v, _monochrome_array(v)),
+}
+
 
 # !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
 
-def simulate_image(img_path, colorblind_type):
+def _image_scale(dtype):
+    """
+    Value representing full intensity for images with the given dtype: the maximum
+    value of integer dtypes (e.g. 255 for uint8) or 1 for float dtypes.
     """
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+
+    return 1
+
 
-    :param img_path:
+# lookup tables of filtered colours, built lazily by get_lut
+_LUTS = {}
+
+
+def _build_lut(colorblind_type, size):
+    """
+    Evaluate colorblind_filter on a size x size x size grid of (r,g,b) colours, one
+    red value at a time to bound memory use.
+    """
+    values = np.linspace(0, 1, size)
+    exact = size == 256
+
+    lut = np.empty((size, size, size, 3), dtype=np.uint8 if exact else np.float32)
+    plane = np.empty((size, size, 3))
+    plane[:, :, 1] = values[:, np.newaxis]
+    plane[:, :, 2] = values[np.newaxis, :]
+
+    for i, r in enumerate(values):
+        plane[:, :, 0] = r
+        filtered = colorblind_filter(plane, colorblind_type)
+        lut[i] = np.rint(filtered * 255) if exact else filtered
+
+    lut.flags.writeable = False
+
+    return lut
+
+
+def get_lut(colorblind_type="Deuteranomaly", size=33):
+    """
+    Get a 3D lookup table of colorblind_filter evaluated on a regular grid of (r,g,b)
+    colours, for fast simulation of colourblindness in large images (see apply_lut and
+    filter_image). Tables are built the first time they're requested and then cached.
 
     :param colorblind_type: Type of colourblindness to simulate, can be:
 
@@ -175,22 +304,259 @@ def simulate_image(img_path, colorblind_type):
         * 'Achromatopsia': Total colourblindness
         * 'Achromatomaly': Total colourblindness
 
-    :return:
+    :param size: Number of grid points along each of the r, g and b axes, e.g. 33 or
+        65. size=256 gives a table with an entry for every 8-bit colour, which is exact
+        (to 8-bit precision) for uint8 images.
+
+    :return: read-only array with shape (size, size, size, 3), where lut[i, j, k] is
+        the filtered colour of (i, j, k) / (size - 1). The table is float32 with values
+        between 0 and 1, or uint8 with values between 0 and 255 if size=256.
     """
-    import matplotlib.image as mpimg
-    import matplotlib.pyplot as plt
+    if colorblind_type not in fBlind:
+        raise ValueError("colorblind_type must be one of " + str(list(fBlind)))
+    if size < 2:
+        raise ValueError("size must be at least 2")
 
-    filter_function = fBlind[colorblind_type]
+    key = (colorblind_type, int(size))
+    if key not in _LUTS:
+        _LUTS[key] = _build_lut(colorblind_type, int(size))
 
-    img = mpimg.imread(img_path)
-    n_rows = img.shape[0]
-    n_columns = img.shape[1]
+    return _LUTS[key]
+
+
+def save_lut(path, colorblind_type="Deuteranomaly", size=33):
+    """
+    Save a lookup table from get_lut to disk, so it can be loaded with load_lut rather
+    than being rebuilt in a new process.
 
-    filtered_img = np.zeros((n_rows, n_columns, 3))
+    :param path: Path of the .npz file to create.
 
-    for r in range(n_rows):
-        for c in range(n_columns):
-            filtered_img[r, c] = filter_function(img[r, c, 0:3])
+    :param colorblind_type: Type of colourblindness, see get_lut.
+
+    :param size: Number of grid points along each axis, see get_lut.
+    """
+    np.savez(
+        path,
+        lut=get_lut(colorblind_type, size),
+        colorblind_type=np.array(colorblind_type),
+    )
+
+
+def load_lut(path):
+    """
+    Load a lookup table saved with save_lut and add it to the cache used by get_lut
+    and filter_image.
+
+    :param path: Path to a .npz file created by save_lut.
+
+    :return: The lookup table, see get_lut.
+    """
+    with np.load(path) as data:
+        lut = data["lut"]
+        colorblind_type = str(data["colorblind_type"])
+
+    if colorblind_type not in fBlind or lut.ndim != 4 or lut.shape[3] != 3:
+        raise ValueError(str(path) + " is not a colourblindness lookup table")
+
+    lut.flags.writeable = False
+    _LUTS[(colorblind_type, lut.shape[0])] = lut
+
+    return lut
+
+
+def apply_lut(colors, lut):
+    """
+    Simulate colourblindness using a lookup table from get_lut. uint8 colours with a
+    size 256 table are looked up directly, otherwise values are found with trilinear
+    interpolation between the grid points of the table.
+
+    :param colors: Array of colours with shape (..., 3). Floats should be between 0
+        and 1, integer arrays are scaled by the maximum value of their dtype.
+
+    :param lut: A lookup table from get_lut.
+
+    :return: float array of filtered colours between 0 and 1, with the same shape as
+        colors.
+    """
+    colors = np.asarray(colors)
+    size = lut.shape[0]
+    lut_scale = _image_scale(lut.dtype)
+    flat_lut = lut.reshape(-1, 3)
+    shape = colors.shape
+    colors = colors.reshape(-1, 3)
+
+    if colors.dtype == np.uint8 and size == 256:
+        index = (colors[:, 0].astype(np.intp) * size + colors[:, 1]) * size
+        index += colors[:, 2]
+        return (np.take(flat_lut, index, axis=0) / lut_scale).reshape(shape)
+
+    position = colors.astype(np.float32) * np.float32(
+        (size - 1) / _image_scale(colors.dtype)
+    )
+    np.clip(position, 0, size - 1, out=position)
+    lower = np.minimum(position.astype(np.intp), size - 2)
+    fraction = position - lower.astype(np.float32)
+    base = (lower[:, 0] * size + lower[:, 1]) * size + lower[:, 2]
+
+    # interpolate between the 8 grid points surrounding each colour
+    weights = [(1 - fraction[:, axis], fraction[:, axis]) for axis in range(3)]
+    filtered = np.zeros(colors.shape, dtype=np.float32)
+    for r, g, b in np.ndindex(2, 2, 2):
+        weight = weights[0][r] * weights[1][g] * weights[2][b]
+        corner = np.take(flat_lut, base + ((r * size + g) * size + b), axis=0)
+        filtered += weight[:, np.newaxis] * corner
+
+    return (filtered.astype(float) / lut_scale).reshape(shape)
+
+
+def lut_error(colorblind_type="Deuteranomaly", size=33, n_samples=100000, seed=0):
+    """
+    Measure the error of a lookup table from get_lut compared to the exact
+    colorblind_filter, on random colours. For size=256 tables the random colours are
+    8-bit, so the error is the 8-bit rounding of the table.
+
+    :param colorblind_type: Type of colourblindness, see get_lut.
+
+    :param size: Number of grid points along each axis, see get_lut.
+
+    :param n_samples: Number of random colours to compare.
+
+    :param seed: Seed for the random colours.
+
+    :return: dict with the maximum ("max") and mean ("mean") absolute difference
+        between the table and exact filtered (r,g,b) values, which are between 0 and 1.
+    """
+    rng = np.random.default_rng(seed)
+    lut = get_lut(colorblind_type, size)
+
+    if size == 256:
+        colors = rng.integers(0, 256, size=(n_samples, 3), dtype=np.uint8)
+        exact = colorblind_filter(colors / 255, colorblind_type)
+    else:
+        colors = rng.random((n_samples, 3))
+        exact = colorblind_filter(colors, colorblind_type)
+
+    error = np.abs(apply_lut(colors, lut) - exact)
+
+    return {"max": float(error.max()), "mean": float(error.mean())}
+
+
+def filter_image(
+    img, colorblind_type="Deuteranomaly", out=None, chunk_rows=256, lut_size=None
+):
+    """
+    Simulate how an image would look to a person with colourblindness. The image is
+    filtered in chunks of rows with the vectorised colorblind_filter, so temporary
+    memory use is bounded by chunk_rows rather than the size of the image.
+
+    :param img: Image array with shape (rows, columns) or (rows, columns, channels).
+        Only the first three (r,g,b) channels are used, so e.g. rgba images can be
+        given directly. Float images should have values between 0 and 1, integer
+        images (e.g. uint8) are scaled by the maximum value of their dtype.
+
+    :param colorblind_type: Type of colourblindness to simulate, can be:
+
+        * 'Normal': Normal vision
+        * 'Protanopia': Red-green colorblindness (1% males)
+        * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
+        * 'Deuteranopia': Red-green colorblindness (1% males)
+        * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
+          0.4% females)
+        * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
+        * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
+        * 'Achromatopsia': Total colourblindness
+        * 'Achromatomaly': Total colourblindness
+
+    :param out: Array of shape (rows, columns, 3) to write the filtered image to, for
+        example a preallocated array or np.memmap. If out has an integer dtype the
+        filtered values are scaled to its maximum value and rounded. If None a new
+        float array is created.
+
+    :param chunk_rows: Number of image rows to filter at once, at least 1.
+
+    :param lut_size: If None, filter every pixel exactly. Otherwise use a lookup table
+        with lut_size grid points per axis from get_lut, which is faster for large
+        images. lut_size=256 with a uint8 image looks up each pixel directly. See
+        lut_error for the accuracy of the tables.
+
+    :return: The filtered image, with shape (rows, columns, 3). This is out if it was
+        given.
+    """
+    if colorblind_type not in fBlind:
+        raise ValueError("colorblind_type must be one of " + str(list(fBlind)))
+    chunk_rows = int(chunk_rows)
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1")
+
+    img = np.asarray(img)
+    if img.ndim == 2:
+        img = img[:, :, np.newaxis]
+    n_rows, n_columns = img.shape[:2]
+
+    if out is None:
+        out = np.empty((n_rows, n_columns, 3))
+    elif out.shape != (n_rows, n_columns, 3):
+        raise ValueError(
+            "out should have shape {}, not {}".format((n_rows, n_columns, 3), out.shape)
+        )
+
+    lut = None if lut_size is None else get_lut(colorblind_type, lut_size)
+    in_scale = _image_scale(img.dtype)
+    out_scale = _image_scale(out.dtype)
+
+    for start in range(0, n_rows, chunk_rows):
+        chunk = img[start : start + chunk_rows, :, 0:3]
+        if chunk.shape[2] != 3:
+            # greyscale image
+            chunk = np.repeat(chunk[:, :, 0:1], 3, axis=2)
+
+        if lut is not None:
+            filtered = apply_lut(chunk, lut)
+        else:
+            chunk = chunk.astype(float)
+            if in_scale != 1:
+                chunk /= in_scale
+            filtered = colorblind_filter(chunk, colorblind_type)
+
+        if out_scale != 1:
+            filtered = np.rint(filtered * out_scale)
+        out[start : start + chunk_rows] = filtered
+
+    return out
+
+
+def simulate_image(img_path, colorblind_type, show=True, chunk_rows=256):
+    """
+    Display an image as it appears with normal vision and with a type of
+    colourblindness, side by side. Use filter_image to simulate colourblindness
+    without plotting.
+
+    :param img_path: Path to the image file to read with matplotlib.
+
+    :param colorblind_type: Type of colourblindness to simulate, can be:
+
+        * 'Normal': Normal vision
+        * 'Protanopia': Red-green colorblindness (1% males)
+        * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
+        * 'Deuteranopia': Red-green colorblindness (1% males)
+        * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
+          0.4% females)
+        * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
+        * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
+        * 'Achromatopsia': Total colourblindness
+        * 'Achromatomaly': Total colourblindness
+
+    :param show: if True, calls ``plt.show()``.
+
+    :param chunk_rows: Number of image rows to filter at once, see filter_image.
+
+    :return: The filtered image as a float array with shape (rows, columns, 3).
+    """
+    import matplotlib.image as mpimg
+    import matplotlib.pyplot as plt
+
+    img = mpimg.imread(img_path)
+    filtered_img = filter_image(img, colorblind_type, chunk_rows=chunk_rows)
 
     fig, axes = plt.subplots(1, 2, figsize=(12, 6))
 
@@ -203,7 +569,10 @@ def simulate_image(img_path, colorblind_type):
     axes[0].set_title("Normal Vision")
     axes[1].set_title("With " + colorblind_type)
 
-    plt.show()
+    if show:
+        plt.show()
+
+    return filtered_img
 
 
 def colorblind_filter(color, colorblind_type="Deuteranomaly"):
@@ -211,7 +580,10 @@ def colorblind_filter(color, colorblind_type="Deuteranomaly"):
     Transforms an (r,g,b) colour into a simulation of how a person with colourblindnes
     would see that colour.
 
-    :param color: rgb colour tuple to convert
+    :param color: rgb colour tuple to convert, or an array of colours with shape
+        (..., 3), e.g. (N, 3) for a list of colours or (rows, columns, 3) for an image.
+        Arrays are filtered with vectorised operations. Only the first three (r,g,b)
+        values of each colour are used, so e.g. rgba colours can be given directly.
 
     :param colorblind_type: Type of colourblindness to simulate, can be:
 
@@ -226,8 +598,16 @@ def colorblind_filter(color, colorblind_type="Deuteranomaly"):
         * 'Achromatopsia': Total colourblindness
         * 'Achromatomaly': Total colourblindness
 
-    :return:
+    :return: the filtered colour as an (r,g,b) tuple, or a float array with shape
+        (..., 3) if color was an array of colours.
     """
+    if isinstance(color, np.ndarray) and color.ndim > 1:
+        filter_function = _fBlind_array[colorblind_type]
+        shape = color.shape[:-1] + (3,)
+        colors = color[..., :3].reshape(-1, 3).astype(float, copy=False)
+
+        return filter_function(colors).reshape(shape)
+
     filter_function = fBlind[colorblind_type]
 
     return filter_function(color)
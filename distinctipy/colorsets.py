@@ -1,9 +1,41 @@
 """
 Provides access to a large list of 200 colors for "normal" and "deuteranomaly"
 vision.
+
+The colours are stored as (n, 3) float64 .npy files in the _colorsets directory and
+only loaded (memory-mapped) the first time each set is used.
 """
+import functools
+import os
+
+import numpy as np
+
 from . import distinctipy
-from ._colorsets_data import colors
+
+_COLORSETS_DIR = os.path.join(os.path.dirname(__file__), "_colorsets")
+
+# names of the built-in colour sets, each stored in _COLORSETS_DIR/<name>.npy
+_COLORSET_NAMES = ("normal", "deuteranomaly")
+
+
+def __getattr__(name):
+    """
+    Build the colors dictionary of all built-in colour sets on first access.
+    """
+    if name == "colors":
+        colors = {colorset: get_colors(colorset) for colorset in _COLORSET_NAMES}
+        globals()["colors"] = colors
+        return colors
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_colorset(name):
+    """
+    Memory-map the read-only (n, 3) array of colours in a built-in colour set.
+    """
+    return np.load(os.path.join(_COLORSETS_DIR, name + ".npy"), mmap_mode="r")
 
 
 def list_colorsets():
@@ -12,7 +44,7 @@ def list_colorsets():
 
     :return: A tuple of keys present in the dictionary distinctipy.colorsets.colors
     """
-    return tuple(["colorblind"] + list(colors.keys()))
+    return tuple(["colorblind"] + list(_COLORSET_NAMES))
 
 
 def __process_name(name):
@@ -38,23 +70,30 @@ def get_colormap(name="normal"):
     name = __process_name(name)
     assert name in list_colorsets(), "name should exist in " + str(list_colorsets())
 
-    return distinctipy.get_colormap(colors[name], name="distinctipy_" + name)
+    return distinctipy.get_colormap(get_colors(name), name="distinctipy_" + name)
 
 
-def get_colors(name="normal"):
+def get_colors(name="normal", as_array=False):
     """
     Return a list of built-in colours generated with distinctipy.
 
     :param name: The name of a colour set present in
         distinctipy.colorsets.list_colorsets()
 
+    :param as_array: If True, return the colours as a read-only (n, 3) float64 numpy
+        array, memory-mapped from the file the set is stored in without copying it.
+
     :return: A list of (r,g,b) colour tuples, where r, g and b are floats between 0
-        and 1.
+        and 1 (or an array, if as_array is True).
     """
     name = __process_name(name)
     assert name in list_colorsets(), "name should exist in " + str(list_colorsets())
 
-    return colors[name]
+    colors = _load_colorset(name)
+    if as_array:
+        return colors
+
+    return [tuple(color) for color in colors.tolist()]
 
 
 def set_palette(name="normal"):
@@ -69,5 +108,6 @@ def set_palette(name="normal"):
     name = __process_name(name)
     assert name in list_colorsets(), "name should exist in " + str(list_colorsets())
 
-    mpl.rcParams["axes.prop_cycle"] = mpl.cycler(color=colors[name])
-    mpl.rcParams["patch.facecolor"] = colors[name][0]
+    colors = get_colors(name)
+    mpl.rcParams["axes.prop_cycle"] = mpl.cycler(color=colors)
+    mpl.rcParams["patch.facecolor"] = colors[0]
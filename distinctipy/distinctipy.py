@@ -1,5 +1,12 @@
+import concurrent.futures
+import functools
+import hashlib
+import itertools
 import math
+import os
 import random
+import tempfile
+import time
 
 import numpy as np
 
@@ -54,6 +61,48 @@ POINTS_OF_INTEREST = CORNERS + MID_FACE + INTERIOR
 
 _SEED_MAX = int(2**32 - 1)
 
+# maximum number of pairwise distances held in memory at once when comparing arrays
+# of colours (the perceptual metrics use many temporary arrays, so use fewer pairs)
+_DISTANCE_CHUNK_SIZE = 2**20
+_PERCEPTUAL_CHUNK_SIZE = 2**16
+
+# D65 reference white and sRGB to XYZ matrix for converting colours to CIELAB
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+_SRGB_TO_XYZ = np.array(
+    [
+        [0.4124564, 0.3575761, 0.1804375],
+        [0.2126729, 0.7151522, 0.0721750],
+        [0.0193339, 0.1191920, 0.9503041],
+    ]
+)
+
+# exclude sets with at least this many colours are put in a _ColorGrid index
+_GRID_MIN_COLORS = 4096
+
+# total size of the palette files kept in a get_colors cache_dir, least recently used
+# palettes are deleted beyond this
+_PALETTE_CACHE_MAX_BYTES = 2**26
+
+
+def _new_pick_stats():
+    """
+    Counters for the work done to pick one colour, reported by get_colors(on_color=).
+    """
+    return {
+        "candidates": 0,
+        "distance_evaluations": 0,
+        "filtered_colors": 0,
+        "nearest_distance": math.inf,
+    }
+
+
+def _count(stats, key, n):
+    """
+    Add n to stats[key], if stats is not None.
+    """
+    if stats is not None:
+        stats[key] += int(n)
+
 
 def _ensure_rng(rng):
     """
@@ -80,232 +129,2145 @@ def _ensure_rng(rng):
     return rng
 
 
-def get_random_color(pastel_factor=0.0, rng=None):
-    """
-    Generate a random rgb colour.
+def get_random_color(pastel_factor=0.0, rng=None):
+    """
+    Generate a random rgb colour.
+
+    :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
+        be generated.
+
+    :param rng: A random integer seed or random.Random state.
+        If unspecified the global random is used.
+
+    :return: color: a (r,g,b) tuple. r, g and b are values between 0 and 1.
+    """
+    rng = _ensure_rng(rng)
+
+    color = [(rng.random() + pastel_factor) / (1.0 + pastel_factor) for _ in range(3)]
+
+    return tuple(color)
+
+
+def _sobol_directions(n_bits=32):
+    """
+    Direction numbers for the first three dimensions of the Sobol sequence, as an
+    (n_bits, 3) array of integers. The dimensions use the primitive polynomials 1,
+    x + 1 and x^2 + x + 1 with initial numbers m = (1), (1) and (1, 3).
+    """
+    directions = [[1 << (n_bits - 1 - k) for k in range(n_bits)]]
+
+    v = [1 << (n_bits - 1)]
+    for k in range(1, n_bits):
+        v.append(v[k - 1] ^ (v[k - 1] >> 1))
+    directions.append(v)
+
+    v = [1 << (n_bits - 1), 3 << (n_bits - 2)]
+    for k in range(2, n_bits):
+        v.append(v[k - 1] ^ v[k - 2] ^ (v[k - 2] >> 2))
+    directions.append(v)
+
+    return np.array(directions, dtype=np.uint64).T
+
+
+class _RandomSampler:
+    """
+    Draws candidate colours uniformly at random, consuming rng in the same way as
+    get_random_color.
+    """
+
+    def __init__(self, pastel_factor=0.0, rng=None):
+        self.pastel_factor = pastel_factor
+        self.rng = _ensure_rng(rng)
+
+    def _sample_unit_cube(self, n_colors):
+        return np.array(
+            [self.rng.random() for _ in range(3 * n_colors)], dtype=float
+        ).reshape(n_colors, 3)
+
+    def sample(self, n_colors):
+        """
+        :return: (n_colors, 3) array of candidate (r,g,b) colours, respecting
+            pastel_factor.
+        """
+        values = self._sample_unit_cube(n_colors)
+
+        return (values + self.pastel_factor) / (1.0 + self.pastel_factor)
+
+    def sample_candidates(
+        self, n_colors, colorblind_type=None, stats=None, metric="redmean"
+    ):
+        """
+        :return: tuple of an (n_colors, 3) array of candidate colours and the same
+            colours after applying the colorblind_type filter (and converting them for
+            metric, see _simulate_colors).
+        """
+        candidates = self.sample(n_colors)
+
+        return candidates, _simulate_colors(
+            candidates, colorblind_type, stats=stats, metric=metric
+        )
+
+
+class _HaltonSampler(_RandomSampler):
+    """
+    Draws candidate colours from a Halton sequence in bases 2, 3 and 5, scrambled with
+    random permutations of the digits at each position and started at a random index.
+    Successive calls to sample continue the same sequence.
+    """
+
+    bases = (2, 3, 5)
+
+    def __init__(self, pastel_factor=0.0, rng=None):
+        super().__init__(pastel_factor=pastel_factor, rng=rng)
+
+        # enough digits to resolve 2^-32 in each base
+        self.permutations = []
+        for base in self.bases:
+            n_digits = int(np.ceil(32 / np.log2(base)))
+            perms = []
+            for _ in range(n_digits):
+                perm = list(range(base))
+                self.rng.shuffle(perm)
+                perms.append(perm)
+            self.permutations.append(np.array(perms))
+
+        self.index = self.rng.randrange(2**20)
+
+    def _sample_unit_cube(self, n_colors):
+        index = np.arange(self.index, self.index + n_colors)
+        self.index += n_colors
+
+        values = np.zeros((n_colors, 3))
+        for axis, (base, perms) in enumerate(zip(self.bases, self.permutations)):
+            remaining = index.copy()
+            scale = 1.0 / base
+            for perm in perms:
+                values[:, axis] += perm[remaining % base] * scale
+                remaining //= base
+                scale /= base
+
+        return values
+
+
+class _SobolSampler(_RandomSampler):
+    """
+    Draws candidate colours from a three dimensional Sobol sequence, scrambled with a
+    random digital shift. Successive calls to sample continue the same sequence.
+    """
+
+    n_bits = 32
+    directions = _sobol_directions(n_bits)
+
+    def __init__(self, pastel_factor=0.0, rng=None):
+        super().__init__(pastel_factor=pastel_factor, rng=rng)
+
+        self.shift = np.array(
+            [self.rng.getrandbits(self.n_bits) for _ in range(3)], dtype=np.uint64
+        )
+        self.index = 0
+
+    def _sample_unit_cube(self, n_colors):
+        index = np.arange(self.index, self.index + n_colors, dtype=np.uint64)
+        self.index += n_colors
+
+        values = np.tile(self.shift, (n_colors, 1))
+        for bit in range(self.n_bits):
+            has_bit = ((index >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            values[has_bit] ^= self.directions[bit]
+
+        return values / float(2**self.n_bits)
+
+
+def _make_candidate_lattice(
+    pastel_factor=0.0, colorblind_type=None, size=10, metric="redmean"
+):
+    """
+    A regular size x size x size lattice of candidate colours spanning the colours
+    allowed by pastel_factor, and the lattice after applying the colorblind_type
+    filter (and converting it for metric). Both are read-only contiguous arrays.
+    """
+    values = np.linspace(pastel_factor / (1.0 + pastel_factor), 1.0, size)
+    candidates = np.stack(
+        np.meshgrid(values, values, values, indexing="ij"), axis=-1
+    ).reshape(-1, 3)
+    compare_candidates = _simulate_colors(candidates, colorblind_type, metric=metric)
+    if compare_candidates is candidates:
+        compare_candidates = candidates.copy()
+
+    candidates.flags.writeable = False
+    compare_candidates.flags.writeable = False
+
+    return candidates, compare_candidates
+
+
+@functools.lru_cache(maxsize=32)
+def _candidate_lattice(
+    pastel_factor=0.0, colorblind_type=None, size=10, metric="redmean"
+):
+    """
+    _make_candidate_lattice cached for the most recently used combinations of
+    arguments. Only used for the small lattices of _LatticeSampler, as the cache is
+    bounded by number of entries rather than memory.
+    """
+    return _make_candidate_lattice(pastel_factor, colorblind_type, size, metric)
+
+
+class _LatticeSampler(_RandomSampler):
+    """
+    Uses a fixed lattice of about n_attempts candidate colours, which is cached
+    (along with its colourblind-filtered version) and reused by later calls with the
+    same pastel_factor, colorblind_type, metric and lattice size. Individual colours
+    (e.g. to replace picked candidates in the incremental mode of get_colors) are
+    random.
+    """
+
+    def sample_candidates(
+        self, n_colors, colorblind_type=None, stats=None, metric="redmean"
+    ):
+        size = max(2, int(round(n_colors ** (1 / 3))))
+
+        return _candidate_lattice(self.pastel_factor, colorblind_type, size, metric)
+
+
+_SAMPLERS = {
+    "random": _RandomSampler,
+    "halton": _HaltonSampler,
+    "sobol": _SobolSampler,
+    "lattice": _LatticeSampler,
+}
+
+
+def _make_sampler(sampler="random", pastel_factor=0.0, rng=None):
+    """
+    Create the candidate colour sampler with the given name.
+    """
+    if sampler not in _SAMPLERS:
+        raise ValueError("sampler must be one of " + str(list(_SAMPLERS)))
+
+    return _SAMPLERS[sampler](pastel_factor=pastel_factor, rng=rng)
+
+
+def _paired_color_distances(colors1, colors2):
+    """
+    Vectorised version of color_distance for arrays of colours with shape (..., 3),
+    computing the distance between corresponding colours (with numpy broadcasting).
+    """
+    r1, g1, b1 = colors1[..., 0], colors1[..., 1], colors1[..., 2]
+    r2, g2, b2 = colors2[..., 0], colors2[..., 1], colors2[..., 2]
+
+    mean_r = (r1 + r2) / 2
+    delta_r = (r1 - r2) ** 2
+    delta_g = (g1 - g2) ** 2
+    delta_b = (b1 - b2) ** 2
+
+    return (2 + mean_r) * delta_r + 4 * delta_g + (3 - mean_r) * delta_b
+
+
+def _srgb_to_lab(colors):
+    """
+    Convert an (..., 3) array of (r,g,b) colours to CIELAB (L*, a*, b*) coordinates,
+    assuming sRGB colours and a D65 white point.
+    """
+    rgb = np.clip(colors, 0.0, 1.0)
+    linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    xyz = (linear @ _SRGB_TO_XYZ.T) / _D65_WHITE
+
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+
+    return np.stack(
+        [
+            116 * f[..., 1] - 16,
+            500 * (f[..., 0] - f[..., 1]),
+            200 * (f[..., 1] - f[..., 2]),
+        ],
+        axis=-1,
+    )
+
+
+def _paired_cie76_distances(lab1, lab2):
+    """
+    CIE76 colour difference (Euclidean distance) between corresponding colours in two
+    (..., 3) arrays of CIELAB colours.
+    """
+    return np.sqrt(((lab1 - lab2) ** 2).sum(axis=-1))
+
+
+def _paired_cie94_distances(lab1, lab2):
+    """
+    CIE94 colour difference (graphic arts weights) between corresponding colours in
+    two (..., 3) arrays of CIELAB colours, with lab1 as the reference colours.
+    """
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    C1 = np.hypot(a1, b1)
+    delta_C = C1 - np.hypot(a2, b2)
+    delta_H2 = np.maximum((a1 - a2) ** 2 + (b1 - b2) ** 2 - delta_C**2, 0)
+
+    delta_L2 = (L1 - L2) ** 2
+    delta_C2 = (delta_C / (1 + 0.045 * C1)) ** 2
+    delta_H2 = delta_H2 / (1 + 0.015 * C1) ** 2
+
+    return np.sqrt(delta_L2 + delta_C2 + delta_H2)
+
+
+def _paired_ciede2000_distances(lab1, lab2):
+    """
+    CIEDE2000 colour difference between corresponding colours in two (..., 3) arrays
+    of CIELAB colours, following Sharma, Wu and Dalal (2005).
+    """
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    C_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    G = 0.5 * (1 - np.sqrt(C_mean7 / (C_mean7 + 25.0**7)))
+    a1 = (1 + G) * a1
+    a2 = (1 + G) * a2
+
+    C1 = np.hypot(a1, b1)
+    C2 = np.hypot(a2, b2)
+    h1 = np.arctan2(b1, a1) % (2 * np.pi)
+    h2 = np.arctan2(b2, a2) % (2 * np.pi)
+
+    # hue difference and mean hue, taking the short way round the hue circle
+    chroma_product = C1 * C2
+    delta_h = h2 - h1
+    delta_h = np.where(delta_h > np.pi, delta_h - 2 * np.pi, delta_h)
+    delta_h = np.where(delta_h < -np.pi, delta_h + 2 * np.pi, delta_h)
+    delta_h = np.where(chroma_product == 0, 0.0, delta_h)
+
+    h_sum = h1 + h2
+    h_wrapped = np.where(h_sum < 2 * np.pi, h_sum + 2 * np.pi, h_sum - 2 * np.pi)
+    h_mean = np.where(np.abs(h1 - h2) > np.pi, h_wrapped, h_sum) / 2
+    h_mean = np.where(chroma_product == 0, h_sum, h_mean)
+
+    delta_L = L2 - L1
+    delta_C = C2 - C1
+    delta_H = 2 * np.sqrt(chroma_product) * np.sin(delta_h / 2)
+
+    L_mean50 = ((L1 + L2) / 2 - 50) ** 2
+    C_mean7 = ((C1 + C2) / 2) ** 7
+
+    T = 1 - 0.17 * np.cos(h_mean - np.radians(30))
+    T += 0.24 * np.cos(2 * h_mean)
+    T += 0.32 * np.cos(3 * h_mean + np.radians(6))
+    T -= 0.20 * np.cos(4 * h_mean - np.radians(63))
+
+    S_L = 1 + 0.015 * L_mean50 / np.sqrt(20 + L_mean50)
+    S_C = 1 + 0.045 * (C1 + C2) / 2
+    S_H = 1 + 0.015 * (C1 + C2) / 2 * T
+
+    rotation = np.radians(60) * np.exp(-(((np.degrees(h_mean) - 275) / 25) ** 2))
+    R_T = -2 * np.sqrt(C_mean7 / (C_mean7 + 25.0**7)) * np.sin(rotation)
+
+    term_L = delta_L / S_L
+    term_C = delta_C / S_C
+    term_H = delta_H / S_H
+
+    return np.sqrt(term_L**2 + term_C**2 + term_H**2 + R_T * term_C * term_H)
+
+
+# distance between corresponding colours for each metric, taking colours that have
+# been passed through _simulate_colors with the same metric
+_METRICS = {
+    "redmean": _paired_color_distances,
+    "cie76": _paired_cie76_distances,
+    "cie94": _paired_cie94_distances,
+    "ciede2000": _paired_ciede2000_distances,
+}
+
+
+def _check_metric(metric):
+    """
+    Raise a ValueError if metric isn't the name of a colour distance metric.
+    """
+    if metric not in _METRICS:
+        raise ValueError("metric must be one of " + str(list(_METRICS)))
+
+
+def _distance_chunk_size(metric="redmean"):
+    """
+    Maximum number of pairwise distances to compute at once with metric.
+    """
+    if metric == "redmean":
+        return _DISTANCE_CHUNK_SIZE
+
+    return min(_DISTANCE_CHUNK_SIZE, _PERCEPTUAL_CHUNK_SIZE)
+
+
+def _color_distances(colors1, colors2, metric="redmean"):
+    """
+    Vectorised version of color_distance.
+
+    :param colors1: (n, 3) array of (r,g,b) colours.
+
+    :param colors2: (m, 3) array of (r,g,b) colours.
+
+    :param metric: Name of the distance metric, see get_colors. For metrics other
+        than redmean colors1 and colors2 should be CIELAB colours.
+
+    :return: (n, m) array with the color_distance between each colour in colors1 and
+        each colour in colors2.
+    """
+    return _METRICS[metric](colors1[:, np.newaxis, :], colors2[np.newaxis, :, :])
+
+
+def _nearest_distances(colors, others, grid=None, stats=None, metric="redmean"):
+    """
+    For each colour in colors find the color_distance to its nearest neighbour in
+    others. others is processed in chunks to bound memory use.
+
+    :param colors: (n, 3) array of (r,g,b) colours.
+
+    :param others: (m, 3) array of (r,g,b) colours, m > 0.
+
+    :param grid: Optional _ColorGrid index of the first grid.n_colors colours in
+        others. Only the remaining colours in others are compared directly.
+
+    :param stats: Optional dict of counters, see _new_pick_stats.
+
+    :param metric: Name of the distance metric, see _color_distances. The grid can
+        only be used with the redmean metric.
+
+    :return: (n,) array of distances.
+    """
+    chunk = max(1, _distance_chunk_size(metric) // max(1, len(colors)))
+
+    nearest = np.full(len(colors), np.inf)
+    if grid is not None:
+        nearest = grid.nearest(colors, stats=stats)
+        others = others[grid.n_colors :]
+
+    _count(stats, "distance_evaluations", len(colors) * len(others))
+
+    for start in range(0, len(others), chunk):
+        distances = _color_distances(colors, others[start : start + chunk], metric)
+        np.minimum(nearest, distances.min(axis=1), out=nearest)
+
+    return nearest
+
+
+def _nearest_indices(colors, others, metric="redmean"):
+    """
+    For each colour in colors find the color_distance to its nearest neighbour in
+    others, and which colour in others that is. others is processed in chunks to bound
+    memory use.
+
+    :param colors: (n, 3) array of (r,g,b) colours.
+
+    :param others: (m, 3) array of (r,g,b) colours.
+
+    :param metric: Name of the distance metric, see _color_distances.
+
+    :return: tuple of an (n,) array of distances (inf if m is 0) and an (n,) array of
+        indices into others (-1 if m is 0).
+    """
+    chunk = max(1, _distance_chunk_size(metric) // max(1, len(colors)))
+    rows = np.arange(len(colors))
+
+    nearest = np.full(len(colors), np.inf)
+    index = np.full(len(colors), -1, dtype=np.intp)
+    for start in range(0, len(others), chunk):
+        distances = _color_distances(colors, others[start : start + chunk], metric)
+        best = distances.argmin(axis=1)
+        best_distances = distances[rows, best]
+        closer = best_distances < nearest
+        nearest[closer] = best_distances[closer]
+        index[closer] = start + best[closer]
+
+    return nearest, index
+
+
+class _ColorGrid:
+    """
+    Uniform grid index over a set of colours, for exact nearest color_distance queries
+    against large sets of colours.
+
+    The colours are sorted by grid cell and the bounding box of each cell is stored.
+    Because the weights of the red and blue terms in color_distance depend on the mean
+    red value, which is bounded within a cell, each cell gives a lower bound on the
+    distance to any colour in it. Queries take the distance to one colour in every
+    cell as an upper bound, and then only compare against the colours in cells whose
+    lower bound is smaller.
+    """
+
+    def __init__(self, colors):
+        colors = np.asarray(colors, dtype=float).reshape(-1, 3)
+        self.n_colors = len(colors)
+
+        # queries scale with both the number of cells and the colours per cell, so
+        # use roughly sqrt(n_colors) cells
+        n_cells = int(np.clip(round((3 * np.sqrt(len(colors))) ** (1 / 3)), 1, 64))
+        lo = colors.min(axis=0)
+        width = np.maximum(colors.max(axis=0) - lo, 1e-12)
+        cell = np.clip(
+            ((colors - lo) / width * n_cells).astype(np.intp), 0, n_cells - 1
+        )
+        cell_id = (cell[:, 0] * n_cells + cell[:, 1]) * n_cells + cell[:, 2]
+
+        order = np.argsort(cell_id, kind="stable")
+        self.colors = colors[order]
+        _, self.starts, self.counts = np.unique(
+            cell_id[order], return_index=True, return_counts=True
+        )
+        self.cell_lo = np.minimum.reduceat(self.colors, self.starts, axis=0)
+        self.cell_hi = np.maximum.reduceat(self.colors, self.starts, axis=0)
+
+    @staticmethod
+    def supports(colors):
+        """
+        The cell lower bounds need non-negative red and blue weights in
+        color_distance, i.e. mean red values between -2 and 3, which is always true
+        for valid colours.
+        """
+        return len(colors) == 0 or (
+            colors[:, 0].min() >= -2 and colors[:, 0].max() <= 3
+        )
+
+    def _lower_bounds(self, points):
+        """
+        (n_points, n_cells) array of lower bounds on the color_distance from each point
+        to any colour in each cell.
+        """
+        p = points[:, np.newaxis, :]
+        gap = np.maximum(np.maximum(self.cell_lo - p, p - self.cell_hi), 0) ** 2
+
+        # smallest possible weights of the red and blue terms within each cell
+        weight_r = 2 + (p[:, :, 0] + self.cell_lo[:, 0]) / 2
+        weight_b = 3 - (p[:, :, 0] + self.cell_hi[:, 0]) / 2
+
+        return weight_r * gap[:, :, 0] + 4 * gap[:, :, 1] + weight_b * gap[:, :, 2]
+
+    def nearest(self, points, chunk_size=256, stats=None):
+        """
+        Exact color_distance from each point to its nearest colour in the grid.
+
+        :param points: (n, 3) array of (r,g,b) colours.
+
+        :param chunk_size: Number of points to process at once.
+
+        :param stats: Optional dict of counters, see _new_pick_stats.
+
+        :return: (n,) array of distances.
+        """
+        nearest = np.empty(len(points))
+        representatives = self.colors[self.starts]
+
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start : start + chunk_size]
+
+            # upper bound: distance to the first colour in each cell
+            best = _color_distances(chunk, representatives).min(axis=1)
+            _count(stats, "distance_evaluations", best.size * len(representatives))
+
+            # all (point, cell) pairs that may contain a closer colour
+            point_idx, cell_idx = np.nonzero(
+                self._lower_bounds(chunk) < best[:, np.newaxis]
+            )
+            if len(point_idx) > 0:
+                # expand each pair to the colours in the cell
+                counts = self.counts[cell_idx]
+                offsets = np.cumsum(counts) - counts
+                color_idx = np.repeat(self.starts[cell_idx] - offsets, counts)
+                color_idx += np.arange(counts.sum())
+                pair_points = np.repeat(point_idx, counts)
+
+                distances = _paired_color_distances(
+                    chunk[pair_points], self.colors[color_idx]
+                )
+                _count(stats, "distance_evaluations", len(distances))
+
+                # pairs are sorted by point, so reduce over each point's segment
+                points_with_pairs, segment_starts = np.unique(
+                    pair_points, return_index=True
+                )
+                best[points_with_pairs] = np.minimum(
+                    best[points_with_pairs],
+                    np.minimum.reduceat(distances, segment_starts),
+                )
+
+            nearest[start : start + chunk_size] = best
+
+        return nearest
+
+
+def _color_grid(colors, metric="redmean"):
+    """
+    A _ColorGrid index of colors if there are enough of them for the index to be worth
+    building, otherwise None. The index only supports the redmean metric.
+    """
+    if metric != "redmean" or len(colors) < _GRID_MIN_COLORS:
+        return None
+
+    if not _ColorGrid.supports(colors):
+        return None
+
+    return _ColorGrid(colors)
+
+
+def _simulate_colors(colors, colorblind_type=None, stats=None, metric="redmean"):
+    """
+    Apply colorblind_filter to an (n, 3) array of colours, returning an (n, 3) array
+    of the colours as they're compared by metric: unchanged for the redmean metric
+    (if colorblind_type is None), or converted to CIELAB for the perceptual metrics.
+    """
+    if colorblind_type:
+        _count(stats, "filtered_colors", len(colors))
+        colors = colorblind.colorblind_filter(colors, colorblind_type)
+
+    if metric != "redmean":
+        colors = _srgb_to_lab(colors)
+
+    return colors
+
+
+def _min_distances_to_others(colors, metric="redmean"):
+    """
+    For each colour in colors, the color_distance to the nearest other colour in
+    colors.
+
+    :param colors: (n, 3) array of (r,g,b) colours.
+
+    :param metric: Name of the distance metric, see _color_distances.
+
+    :return: (n,) array of distances, inf if n < 2.
+    """
+    chunk = max(1, _distance_chunk_size(metric) // max(1, len(colors)))
+
+    nearest = np.empty(len(colors))
+    for start in range(0, len(colors), chunk):
+        distances = _color_distances(colors[start : start + chunk], colors, metric)
+        rows = np.arange(len(distances))
+        distances[rows, start + rows] = np.inf
+        nearest[start : start + chunk] = distances.min(axis=1)
+
+    return nearest
+
+
+def _min_pairwise_distance(
+    colors, colorblind_type=None, exclude_colors=None, metric="redmean"
+):
+    """
+    The smallest color_distance (or metric distance) between any two colours in
+    colors, after applying the colorblind_type filter. Used to measure the quality of
+    a set of colours.
+
+    :param colors: list or (n, 3) array of (r,g,b) colours.
+
+    :param exclude_colors: Optional list of (r,g,b) colours. If given, the distances
+        from colors to their nearest exclude colour are included too (but not the
+        distances between exclude colours).
+
+    :return: float, inf if there are no pairs of colours to compare.
+    """
+    compare = _simulate_colors(
+        np.array(colors, dtype=float).reshape(-1, 3), colorblind_type, metric=metric
+    )
+
+    smallest = np.inf
+    if len(compare) > 1:
+        smallest = _min_distances_to_others(compare, metric).min()
+
+    if exclude_colors is not None and len(exclude_colors) > 0 and len(compare) > 0:
+        compare_exclude = _simulate_colors(
+            np.array(exclude_colors, dtype=float).reshape(-1, 3),
+            colorblind_type,
+            metric=metric,
+        )
+        smallest = min(
+            smallest,
+            _nearest_distances(compare, compare_exclude, metric=metric).min(),
+        )
+
+    return float(smallest)
+
+
+@functools.lru_cache(maxsize=None)
+def _simulated_points_of_interest(colorblind_type=None, metric="redmean"):
+    """
+    POINTS_OF_INTEREST as a read-only (n, 3) array, passed through the colourblindness
+    filter for colorblind_type (and converted for metric). Computed once per type of
+    colourblindness and metric.
+    """
+    points = _simulate_colors(
+        np.array(POINTS_OF_INTEREST, dtype=float), colorblind_type, metric=metric
+    )
+    points.flags.writeable = False
+
+    return points
+
+
+def _points_of_interest_mask(colors):
+    """
+    Boolean mask of the POINTS_OF_INTEREST that are not present in the (n, 3) array
+    colors.
+    """
+    points = _simulated_points_of_interest(None)
+
+    return ~(points[:, None, :] == colors[None, :, :]).all(axis=2).any(axis=1)
+
+
+def color_distance(c1, c2, metric="redmean"):
+    """
+    Metric to define the visual distinction between two (r,g,b) colours.
+    Inspired by: https://www.compuphase.com/cmetric.htm
+
+    :param c1: (r,g,b) colour tuples. r,g and b are values between 0 and 1.
+
+    :param c2: (r,g,b) colour tuples. r,g and b are values between 0 and 1.
+
+    :param metric: The distance metric to use, can be:
+
+        * 'redmean': A weighted distance in (r,g,b) that approximates perceived
+          differences and is cheap to compute (default)
+        * 'cie76': Euclidean distance in CIELAB (Delta E 1976)
+        * 'cie94': CIE94 colour difference in CIELAB, with c1 as the reference colour
+        * 'ciede2000': CIEDE2000 colour difference in CIELAB, the most perceptually
+          uniform but slowest metric
+
+        Colours are treated as sRGB with a D65 white point for the CIELAB metrics.
+
+    :return: distance: float representing visual distinction between c1 and c2.
+        Larger values = more distinct.
+    """
+    if metric != "redmean":
+        _check_metric(metric)
+        lab = _srgb_to_lab(np.array([c1, c2], dtype=float))
+        return float(_METRICS[metric](lab[0], lab[1]))
+
+    r1, g1, b1 = c1
+    r2, g2, b2 = c2
+
+    mean_r = (r1 + r2) / 2
+    delta_r = (r1 - r2) ** 2
+    delta_g = (g1 - g2) ** 2
+    delta_b = (b1 - b2) ** 2
+
+    distance = (2 + mean_r) * delta_r + 4 * delta_g + (3 - mean_r) * delta_b
+
+    return distance
+
+
+def _distance_tiles(colors1, colors2, metric="redmean", chunk_size=None):
+    """
+    Compute the distances between two arrays of colours in tiles of at most about
+    chunk_size distances.
+
+    :return: generator of (row, column, tile) tuples, where tile is the array of
+        distances between colors1[row : row + tile.shape[0]] and
+        colors2[column : column + tile.shape[1]].
+    """
+    if chunk_size is None:
+        chunk_size = _distance_chunk_size(metric)
+
+    n_cols = max(1, min(len(colors2), chunk_size))
+    n_rows = max(1, chunk_size // n_cols)
+
+    for row in range(0, len(colors1), n_rows):
+        for column in range(0, len(colors2), n_cols):
+            yield row, column, _color_distances(
+                colors1[row : row + n_rows], colors2[column : column + n_cols], metric
+            )
+
+
+def color_distance_matrix(
+    colors1,
+    colors2=None,
+    metric="redmean",
+    colorblind_type=None,
+    chunk_size=None,
+    reduce=None,
+    dtype=np.float64,
+):
+    """
+    Vectorised version of color_distance for whole arrays of colours, computed in
+    tiles so that memory use stays bounded for large palettes.
+
+    :param colors1: A list or (n, 3) array of (r,g,b) colours.
+
+    :param colors2: A list or (m, 3) array of (r,g,b) colours. If None, the distances
+        between the colours in colors1 are computed.
+
+    :param metric: The distance metric to use, see color_distance.
+
+    :param colorblind_type: If given, distances are measured between colours as they
+        appear with this type of colourblindness, see get_colors.
+
+    :param chunk_size: Maximum number of distances to compute at once. If None, a
+        default suitable for metric is used.
+
+    :param reduce: What to return, can be:
+
+        * None: The full (n, m) matrix of distances (default)
+        * 'nearest': Only the distance from each colour in colors1 to its nearest
+          colour in colors2 (or to its nearest other colour, if colors2 is None) and
+          the index of that colour, without holding the full matrix in memory
+
+    :param dtype: The floating point type of the returned distances, e.g. np.float32
+        to halve the size of large matrices. Distances are computed in float64.
+
+    :return: (n, m) array of the distances between each colour in colors1 and each
+        colour in colors2, or if reduce is 'nearest' a tuple of an (n,) array of
+        distances (inf if there are no other colours) and an (n,) array of indices
+        (-1 if there are no other colours).
+    """
+    _check_metric(metric)
+    if reduce not in (None, "nearest"):
+        raise ValueError("reduce must be None or 'nearest'")
+
+    compare1 = _simulate_colors(
+        np.asarray(colors1, dtype=float).reshape(-1, 3), colorblind_type, metric=metric
+    )
+    if colors2 is None:
+        compare2 = compare1
+    else:
+        compare2 = _simulate_colors(
+            np.asarray(colors2, dtype=float).reshape(-1, 3),
+            colorblind_type,
+            metric=metric,
+        )
+
+    if reduce is None:
+        distances = np.empty((len(compare1), len(compare2)), dtype=dtype)
+        for row, column, tile in _distance_tiles(
+            compare1, compare2, metric, chunk_size
+        ):
+            distances[row : row + tile.shape[0], column : column + tile.shape[1]] = tile
+        return distances
+
+    nearest = np.full(len(compare1), np.inf)
+    index = np.full(len(compare1), -1, dtype=np.intp)
+    for row, column, tile in _distance_tiles(compare1, compare2, metric, chunk_size):
+        rows = np.arange(tile.shape[0])
+        if colors2 is None:
+            # exclude the distance from each colour to itself
+            own_column = row + rows - column
+            is_own = (own_column >= 0) & (own_column < tile.shape[1])
+            tile[rows[is_own], own_column[is_own]] = np.inf
+
+        best = tile.argmin(axis=1)
+        best_distances = tile[rows, best]
+        closer = best_distances < nearest[row : row + len(rows)]
+        nearest[row : row + len(rows)][closer] = best_distances[closer]
+        index[row : row + len(rows)][closer] = column + best[closer]
+
+    return nearest.astype(dtype, copy=False), index
+
+
+def distinct_color(
+    exclude_colors,
+    pastel_factor=0.0,
+    n_attempts=1000,
+    colorblind_type=None,
+    rng=None,
+    sampler="random",
+    metric="redmean",
+):
+    """
+    Generate a colour as distinct as possible from the colours defined in exclude_colors
+    Inspired by: https://gist.github.com/adewes/5884820
+
+    :param exclude_colors: a list of (r,g,b) tuples. r,g,b are values between 0 and 1.
+
+    :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
+        be generated.
+
+    :param n_attempts: number of random colours to generate to find most distinct colour
+
+    :param colorblind_type: Type of colourblindness to simulate, can be:
+
+        * 'Normal': Normal vision
+        * 'Protanopia': Red-green colorblindness (1% males)
+        * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
+        * 'Deuteranopia': Red-green colorblindness (1% males)
+        * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
+          0.4% females)
+        * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
+        * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
+        * 'Achromatopsia': Total colourblindness
+        * 'Achromatomaly': Total colourblindness
+
+    :param rng: A random integer seed or random.Random state.
+        If unspecified the global random is used.
+
+    :param sampler: How candidate colours are generated, can be:
+
+        * 'random': Independent uniformly random colours (default)
+        * 'halton': A scrambled Halton low-discrepancy sequence
+        * 'sobol': A scrambled Sobol low-discrepancy sequence
+        * 'lattice': A regular lattice of about n_attempts colours, which is cached
+          (with its colourblind-filtered version) and reused between calls
+
+        Low-discrepancy sequences cover the rgb cube more evenly than random colours,
+        but that only gives slightly more distinct colours with a few hundred or more
+        n_attempts (see benchmarks/bench_sampler.py), and they're slower to generate.
+        They're scrambled using rng.
+        The lattice skips generating and filtering candidates on repeated calls.
+
+    :param metric: How the distinction between colours is measured, can be:
+
+        * 'redmean': A weighted distance in (r,g,b), see color_distance (default)
+        * 'cie76': Euclidean distance in CIELAB
+        * 'cie94': CIE94 colour difference
+        * 'ciede2000': CIEDE2000 colour difference
+
+        Colours are converted to CIELAB once each, but the perceptual metrics are
+        still several times slower than redmean (ciede2000 the most).
+
+    :return: (r,g,b) color tuple of the generated colour with the largest minimum
+        color_distance to the colours in exclude_colors.
+    """
+    _check_metric(metric)
+    sampler = _make_sampler(sampler, pastel_factor=pastel_factor, rng=rng)
+
+    if len(exclude_colors) == 0:
+        return tuple(sampler.sample(1)[0].tolist())
+
+    filtered_exclude = _simulate_colors(
+        np.array(exclude_colors, dtype=float).reshape(-1, 3), colorblind_type
+    )
+    compare_exclude = _simulate_colors(filtered_exclude, metric=metric)
+
+    color, _ = _distinct_color(
+        compare_exclude,
+        sampler,
+        n_attempts=n_attempts,
+        colorblind_type=colorblind_type,
+        grid=_color_grid(compare_exclude, metric),
+        metric=metric,
+        keep=_points_of_interest_mask(filtered_exclude),
+    )
+
+    return color
+
+
+def _distinct_color(
+    compare_exclude,
+    sampler,
+    n_attempts=1000,
+    colorblind_type=None,
+    grid=None,
+    stats=None,
+    metric="redmean",
+    keep=None,
+):
+    """
+    Implementation of distinct_color for exclude colours that have already been passed
+    through the colourblindness filter, so they don't need filtering again on every
+    call.
+
+    :param compare_exclude: (n, 3) array of exclude colours after applying the
+        colorblind_type filter.
+
+    :param sampler: Sampler object used to generate candidate colours, see
+        _make_sampler.
+
+    :param grid: Optional _ColorGrid index of the first grid.n_colors colours in
+        compare_exclude.
+
+    :param stats: Optional dict of counters, see _new_pick_stats, updated with the
+        work done to find the colour.
+
+    :param metric: Name of the distance metric. compare_exclude should have been
+        converted for it with _simulate_colors.
+
+    :param keep: Boolean mask of the POINTS_OF_INTEREST to try, from
+        _points_of_interest_mask of the filtered (r,g,b) exclude colours. If None it's
+        computed from compare_exclude, which is only in (r,g,b) for the redmean
+        metric, so it must be given for the other metrics.
+
+    :return: tuple of the (r,g,b) colour tuple found and its filtered (and converted)
+        colour as an array of length 3.
+    """
+    if len(compare_exclude) == 0:
+        color = sampler.sample(1)
+        _count(stats, "candidates", 1)
+        return (
+            tuple(color[0].tolist()),
+            _simulate_colors(color, colorblind_type, stats=stats, metric=metric)[0],
+        )
+
+    # try pre-defined corners, edges, interior points first, then n_attempts randomly
+    # generated colours. On ties the earliest candidate wins.
+    candidates, compare_candidates = sampler.sample_candidates(
+        n_attempts, colorblind_type, stats=stats, metric=metric
+    )
+
+    if sampler.pastel_factor == 0:
+        # points of interest are skipped if they match a (filtered) exclude colour
+        if keep is None:
+            keep = _points_of_interest_mask(compare_exclude)
+        candidates = np.concatenate(
+            [_simulated_points_of_interest(None)[keep], candidates]
+        )
+        compare_candidates = np.concatenate(
+            [
+                _simulated_points_of_interest(colorblind_type, metric)[keep],
+                compare_candidates,
+            ]
+        )
+
+    distance_to_nearest = _nearest_distances(
+        compare_candidates, compare_exclude, grid=grid, stats=stats, metric=metric
+    )
+    best = np.argmax(distance_to_nearest)
+
+    if stats is not None:
+        stats["candidates"] += len(candidates)
+        stats["nearest_distance"] = float(distance_to_nearest[best])
+
+    return tuple(candidates[best].tolist()), compare_candidates[best]
+
+
+def get_text_color(background_color, threshold=0.6):
+    """
+    Choose whether black or white text will work better on top of background_color.
+    Inspired by: https://stackoverflow.com/a/3943023
+
+    :param background_color: The colour the text will be displayed on
+
+    :param threshold: float between 0 and 1. With threshold close to 1 white text will
+        be chosen more often.
+
+    :return: (0,0,0) if black text should be used or (1,1,1) if white text should be
+        used.
+    """
+
+    r, g, b = background_color[0], background_color[1], background_color[2]
+
+    if (r * 0.299 + g * 0.587 + b * 0.114) > threshold:
+        return BLACK
+    else:
+        return WHITE
+
+
+class _CandidatePool:
+    """
+    A pool of candidate colours shared between successive picks of distinct colours.
+
+    Each candidate stores the color_distance to its nearest excluded or already picked
+    colour, so picking a new colour only needs the distances from the candidates to
+    that one colour. Picked candidates are replaced with new colours from the sampler.
+
+    Iterating over a pool picks colours indefinitely (see iter_colors). All of its
+    state is held in numpy arrays and the sampler, so pools can be pickled.
+    """
+
+    def __init__(
+        self,
+        exclude_colors,
+        sampler,
+        n_attempts=1000,
+        colorblind_type=None,
+        metric="redmean",
+    ):
+        exclude_colors = self._init_candidates(
+            exclude_colors, sampler, n_attempts, colorblind_type, metric
+        )
+
+        # simulated versions of the excluded and picked colours, with spare capacity
+        self.n_colors = 0
+        self.compare_colors = np.empty((max(len(exclude_colors), 16), 3))
+        self.nearest = np.full(len(self.candidates), np.inf)
+        self.grid = None
+        if len(exclude_colors) > 0:
+            compare_exclude = _simulate_colors(
+                exclude_colors, colorblind_type, metric=metric
+            )
+            self._add_compare_colors(compare_exclude)
+            self.grid = _color_grid(compare_exclude, metric)
+            self.nearest = _nearest_distances(
+                self.compare_candidates, compare_exclude, grid=self.grid, metric=metric
+            )
+
+    def _init_candidates(
+        self, exclude_colors, sampler, n_attempts, colorblind_type, metric
+    ):
+        """
+        Set up the pool of n_attempts candidates from sampler, preceded by the
+        POINTS_OF_INTEREST not in exclude_colors if pastel_factor is 0.
+
+        :return: exclude_colors as an (n, 3) array.
+        """
+        self.sampler = sampler
+        self.colorblind_type = colorblind_type
+        self.metric = metric
+
+        exclude_colors = np.array(exclude_colors, dtype=float).reshape(-1, 3)
+
+        candidates, compare_candidates = sampler.sample_candidates(
+            max(n_attempts, 1), colorblind_type, metric=metric
+        )
+        # copies, as picked candidates are replaced in place
+        self.candidates = np.array(candidates)
+        self.compare_candidates = np.array(compare_candidates)
+
+        self.n_points_of_interest = 0
+        if sampler.pastel_factor == 0:
+            keep = _points_of_interest_mask(exclude_colors)
+            self.n_points_of_interest = int(keep.sum())
+            self.candidates = np.concatenate(
+                [_simulated_points_of_interest(None)[keep], self.candidates]
+            )
+            self.compare_candidates = np.concatenate(
+                [
+                    _simulated_points_of_interest(colorblind_type, metric)[keep],
+                    self.compare_candidates,
+                ]
+            )
+
+        return exclude_colors
+
+    def _add_compare_colors(self, compare_colors):
+        n_new = self.n_colors + len(compare_colors)
+        if n_new > len(self.compare_colors):
+            grown = np.empty((max(n_new, 2 * len(self.compare_colors)), 3))
+            grown[: self.n_colors] = self.compare_colors[: self.n_colors]
+            self.compare_colors = grown
+        self.compare_colors[self.n_colors : n_new] = compare_colors
+        self.n_colors = n_new
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.pick()
+
+    def pick(self, stats=None):
+        """
+        Choose the candidate with the largest distance to its nearest colour, update
+        the nearest distances with it and replace it in the pool.
+
+        :param stats: Optional dict of counters, see _new_pick_stats, updated with the
+            work done to pick the colour.
+
+        :return: (r,g,b) tuple of the picked colour.
+        """
+        if self.n_colors == 0:
+            # nothing to be distinct from yet, pick a random colour
+            idx = self.n_points_of_interest
+        else:
+            idx = int(np.argmax(self.nearest))
+
+        color = tuple(self.candidates[idx].tolist())
+        if stats is not None:
+            stats["candidates"] += len(self.candidates)
+            stats["nearest_distance"] = float(self.nearest[idx])
+
+        self._add_picked(idx, stats=stats)
+
+        new_candidate = self.sampler.sample(1)
+        self.candidates[idx] = new_candidate
+        self.compare_candidates[idx] = _simulate_colors(
+            new_candidate, self.colorblind_type, stats=stats, metric=self.metric
+        )
+        self._update_nearest(idx, stats=stats)
+
+        return color
+
+    def _add_picked(self, idx, stats=None):
+        """
+        Add candidate idx to the picked colours and update the nearest distances of
+        the candidates with it.
+        """
+        compare_color = self.compare_candidates[idx : idx + 1].copy()
+        self._add_compare_colors(compare_color)
+        np.minimum(
+            self.nearest,
+            _color_distances(self.compare_candidates, compare_color, self.metric)[:, 0],
+            out=self.nearest,
+        )
+        _count(stats, "distance_evaluations", len(self.candidates))
+
+    def _update_nearest(self, idx, stats=None):
+        """
+        Find the nearest distance of the (replaced) candidate idx from scratch.
+        """
+        self.nearest[idx] = _nearest_distances(
+            self.compare_candidates[idx : idx + 1],
+            self.compare_colors[: self.n_colors],
+            grid=self.grid,
+            stats=stats,
+            metric=self.metric,
+        )[0]
+
+
+def get_colors(
+    n_colors,
+    exclude_colors=None,
+    return_excluded=False,
+    pastel_factor=0.0,
+    n_attempts=1000,
+    colorblind_type=None,
+    rng=None,
+    incremental=False,
+    sampler="random",
+    refine_iterations=0,
+    on_color=None,
+    cache_dir=None,
+    metric="redmean",
+):
+    """
+    Generate a list of n visually distinct colours.
+
+    :param n_colors: How many colours to generate
+
+    :param exclude_colors: A list of (r,g,b) colours that new colours should be distinct
+        from. If exclude_colors=None then exclude_colors will be set to avoid white
+        and black (exclude_colors=[(0,0,0), (1,1,1)]). (r,g,b) values should be floats
+        between 0 and 1.
+
+    :param return_excluded: If return_excluded=True then exclude_colors will be included
+        in the returned color list. Otherwise only the newly generated colors are
+        returned (default).
+
+    :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
+        be generated.
+
+    :param n_attempts: number of random colours to generated to find most distinct
+        colour.
+
+    :param colorblind_type: Generate colours that are distinct with given type of
+        colourblindness. Can be:
+
+            * 'Normal': Normal vision
+            * 'Protanopia': Red-green colorblindness (1% males)
+            * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
+            * 'Deuteranopia': Red-green colorblindness (1% males)
+            * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
+            0.4% females)
+            * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
+            * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
+            * 'Achromatopsia': Total colourblindness
+            * 'Achromatomaly': Total colourblindness
+
+    :param rng: A random integer seed or random.Random state.
+        If unspecified the global random is used.
+
+    :param incremental: If True, draw one pool of n_attempts candidate colours that is
+        shared by all the generated colours, keeping track of each candidate's distance
+        to its nearest colour and replacing candidates once they are picked. This
+        scales as O(n_colors * n_attempts) rather than O(n_colors^2 * n_attempts), so
+        is much faster for large n_colors, but gives different colours to the default.
+
+    :param sampler: How candidate colours are generated, can be:
+
+        * 'random': Independent uniformly random colours (default)
+        * 'halton': A scrambled Halton low-discrepancy sequence
+        * 'sobol': A scrambled Sobol low-discrepancy sequence
+        * 'lattice': A regular lattice of about n_attempts colours, which is cached
+          (with its colourblind-filtered version) and reused between calls
+
+        Low-discrepancy sequences cover the rgb cube more evenly than random colours,
+        but that only gives slightly more distinct colours with a few hundred or more
+        n_attempts (see benchmarks/bench_sampler.py), and they're slower to generate.
+        They're scrambled using rng.
+        The lattice skips generating and filtering candidates on repeated calls.
+
+    :param refine_iterations: If greater than 0, nudge the generated colours apart
+        with up to this many iterations of refine_colors after generating them. This
+        is usually a cheaper way to improve the colours than increasing n_attempts.
+        Colours in exclude_colors are not moved.
+
+    :param on_color: Optional function called after each colour is picked, with a
+        dict of statistics about the pick:
+
+        * 'index': Position of the colour among the generated colours
+        * 'color': The (r,g,b) colour picked (before any refinement)
+        * 'candidates': Number of candidate colours evaluated
+        * 'distance_evaluations': Number of color_distance evaluations
+        * 'filtered_colors': Number of colours passed through the colourblindness
+          filter
+        * 'nearest_distance': color_distance from the picked colour to its nearest
+          excluded or previously picked colour (inf for the first colour if there are
+          no exclude_colors)
+        * 'seconds': Time taken to pick the colour
+
+        on_color isn't called for palettes loaded from cache_dir.
+
+    :param cache_dir: Optional path to a directory used to cache generated colours
+        between calls and processes. Only used if rng is an integer or float seed, in
+        which case the colours are a pure function of the arguments. Palettes are
+        stored as small binary files named by a hash of the arguments and the
+        distinctipy version, written atomically so that the directory can be shared
+        by several processes. The least recently used palettes are deleted once the
+        directory holds more than 64 MB of them.
+
+    :param metric: How the distinction between colours is measured, can be:
+
+        * 'redmean': A weighted distance in (r,g,b), see color_distance (default)
+        * 'cie76': Euclidean distance in CIELAB
+        * 'cie94': CIE94 colour difference
+        * 'ciede2000': CIEDE2000 colour difference
+
+        Colours are converted to CIELAB once each, but the perceptual metrics are
+        still several times slower than redmean (ciede2000 the most).
+
+    :return: colors - A list of (r,g,b) colors that are visually distinct to each other
+        and to the colours in exclude_colors. (r,g,b) values are floats between 0 and 1.
+    """
+    _check_metric(metric)
+
+    if exclude_colors is None:
+        exclude_colors = [WHITE, BLACK]
+
+    cache_path = None
+    if cache_dir is not None and isinstance(rng, (int, float)):
+        cache_path = _palette_cache_path(
+            cache_dir,
+            n_colors=n_colors,
+            exclude_colors=exclude_colors,
+            pastel_factor=pastel_factor,
+            n_attempts=n_attempts,
+            colorblind_type=colorblind_type,
+            rng=rng,
+            incremental=incremental,
+            sampler=sampler,
+            refine_iterations=refine_iterations,
+            metric=metric,
+        )
+        cached = _read_cached_palette(cache_path)
+        if cached is not None:
+            return exclude_colors.copy() + cached if return_excluded else cached
+
+    sampler = _make_sampler(sampler, pastel_factor=pastel_factor, rng=rng)
+    colors = exclude_colors.copy()
+
+    if incremental:
+        pool = _CandidatePool(
+            colors,
+            sampler,
+            n_attempts=n_attempts,
+            colorblind_type=colorblind_type,
+            metric=metric,
+        )
+        for i in range(n_colors):
+            stats = None if on_color is None else _new_pick_stats()
+            start = time.perf_counter()
+            colors.append(pool.pick(stats=stats))
+            if on_color is not None:
+                _report_pick(on_color, stats, i, colors[-1], start)
+    else:
+        # simulated versions of colors, so each colour is only filtered once
+        compare_colors = np.empty((len(colors) + n_colors, 3))
+        n_compare = len(colors)
+        # points of interest that don't match a filtered (r,g,b) colour
+        keep = np.ones(len(POINTS_OF_INTEREST), dtype=bool)
+        if n_compare > 0:
+            filtered = _simulate_colors(
+                np.array(colors, dtype=float).reshape(-1, 3), colorblind_type
+            )
+            compare_colors[:n_compare] = _simulate_colors(filtered, metric=metric)
+            keep = _points_of_interest_mask(filtered)
+        # index large exclude sets once, new colours are compared directly
+        grid = _color_grid(compare_colors[:n_compare], metric)
+
+        for i in range(n_colors):
+            stats = None if on_color is None else _new_pick_stats()
+            start = time.perf_counter()
+            color, compare_color = _distinct_color(
+                compare_colors[:n_compare],
+                sampler,
+                n_attempts=n_attempts,
+                colorblind_type=colorblind_type,
+                grid=grid,
+                stats=stats,
+                metric=metric,
+                keep=keep,
+            )
+            colors.append(color)
+            if on_color is not None:
+                _report_pick(on_color, stats, i, color, start)
+            compare_colors[n_compare] = compare_color
+            n_compare += 1
+
+            if metric != "redmean":
+                compare_color = _simulate_colors(np.array([color]), colorblind_type)[0]
+            keep &= _points_of_interest_mask(compare_color[np.newaxis])
+
+    if refine_iterations > 0:
+        colors[len(exclude_colors) :] = refine_colors(
+            colors[len(exclude_colors) :],
+            exclude_colors=exclude_colors,
+            pastel_factor=pastel_factor,
+            colorblind_type=colorblind_type,
+            n_iterations=refine_iterations,
+            metric=metric,
+        )
+
+    if cache_path is not None:
+        _write_cached_palette(cache_path, colors[len(exclude_colors) :])
+
+    if return_excluded:
+        return colors
+    else:
+        return colors[len(exclude_colors) :]
+
+
+@functools.lru_cache(maxsize=None)
+def _library_version():
+    """
+    Installed version of distinctipy, included in palette cache keys as changes to the
+    generation algorithm may change the colours for a given seed.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("distinctipy")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _palette_cache_path(cache_dir, exclude_colors, **kwargs):
+    """
+    Path of the file caching the colours generated by get_colors with the given
+    arguments in cache_dir. Files are named by a hash of the arguments and the
+    distinctipy version.
+    """
+    key = hashlib.sha256()
+    key.update(repr((_library_version(), sorted(kwargs.items()))).encode())
+    key.update(np.array(exclude_colors, dtype=float).reshape(-1, 3).tobytes())
+
+    return os.path.join(cache_dir, key.hexdigest() + ".npy")
+
+
+def _read_cached_palette(path):
+    """
+    Load a list of (r,g,b) colours saved with _write_cached_palette, marking the file
+    as recently used. Returns None if the file doesn't exist or can't be read.
+    """
+    try:
+        colors = np.load(path, allow_pickle=False)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+
+    return [tuple(color) for color in colors.tolist()]
+
+
+def _write_cached_palette(path, colors):
+    """
+    Save a list of (r,g,b) colours as an (n, 3) float64 .npy file, replacing the file
+    atomically so concurrent readers never see a partial palette, and then evict the
+    least recently used palettes in the same directory.
+    """
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.array(colors, dtype=np.float64).reshape(-1, 3))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    _evict_cached_palettes(cache_dir, _PALETTE_CACHE_MAX_BYTES)
+
+
+def _evict_cached_palettes(cache_dir, max_bytes):
+    """
+    Delete the least recently used palette files in cache_dir until they take up at
+    most max_bytes. Files removed by another process in the meantime are skipped.
+    """
+    files = []
+    for entry in os.scandir(cache_dir):
+        if not entry.name.endswith(".npy"):
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def iter_colors(
+    exclude_colors=None,
+    pastel_factor=0.0,
+    n_attempts=1000,
+    colorblind_type=None,
+    rng=None,
+    sampler="random",
+    metric="redmean",
+):
+    """
+    Generate visually distinct colours one at a time, for as long as needed.
+
+    The returned iterator keeps its candidate colours, their distances to the nearest
+    excluded or generated colour and its random state between colours, so each new
+    colour only costs n_attempts distance calculations. It yields the same colours as
+    get_colors(..., incremental=True) with the same arguments. The iterator can be
+    pickled, e.g. to resume generating colours in another process.
+
+    Example:
+        >>> colors = distinctipy.iter_colors(rng=42)
+        >>> first = next(colors)
+        >>> more = list(itertools.islice(colors, 5))
+
+    The parameters are the same as for get_colors.
+
+    :return: An iterator of (r,g,b) colour tuples.
+    """
+    _check_metric(metric)
+
+    if exclude_colors is None:
+        exclude_colors = [WHITE, BLACK]
+
+    return _CandidatePool(
+        exclude_colors,
+        _make_sampler(sampler, pastel_factor=pastel_factor, rng=rng),
+        n_attempts=n_attempts,
+        colorblind_type=colorblind_type,
+        metric=metric,
+    )
+
+
+class PaletteBuilder(_CandidatePool):
+    """
+    Build a list of visually distinct colours step by step, e.g. as series are added
+    to and removed from an interactive plot.
+
+    The builder keeps a pool of n_attempts candidate colours, with the color_distance
+    from each candidate to its nearest excluded or chosen colour and which colour that
+    is. Adding a colour, excluding more colours or removing a colour then only
+    compares the candidates with the colours that changed (and, after a removal,
+    recomputes the candidates whose nearest colour was removed), rather than starting
+    again from scratch. Without removals it picks the same colours as
+    get_colors(..., incremental=True).
+
+    Example:
+        >>> palette = distinctipy.PaletteBuilder(rng=42)
+        >>> palette.add(3)
+        >>> palette.remove(palette.colors[1])
+        >>> palette.add()
+
+    :param exclude_colors: A list of (r,g,b) colours that new colours should be
+        distinct from. If None, exclude_colors will be set to avoid white and black
+        (exclude_colors=[(0,0,0), (1,1,1)]).
+
+    The other parameters are the same as for get_colors.
+    """
+
+    def __init__(
+        self,
+        exclude_colors=None,
+        pastel_factor=0.0,
+        n_attempts=1000,
+        colorblind_type=None,
+        rng=None,
+        sampler="random",
+        metric="redmean",
+    ):
+        _check_metric(metric)
+
+        if exclude_colors is None:
+            exclude_colors = [WHITE, BLACK]
+        exclude_colors = self._init_candidates(
+            exclude_colors,
+            _make_sampler(sampler, pastel_factor=pastel_factor, rng=rng),
+            n_attempts,
+            colorblind_type,
+            metric,
+        )
+
+        # excluded and chosen colours (in the order they were added), their simulated
+        # versions and whether each one is excluded, with spare capacity
+        self.n_colors = 0
+        capacity = max(len(exclude_colors), 16)
+        self._colors = np.empty((capacity, 3))
+        self._compare_colors = np.empty((capacity, 3))
+        self._excluded = np.empty(capacity, dtype=bool)
+
+        # distance from each candidate to its nearest colour, and that colour's index
+        self.nearest = np.full(len(self.candidates), np.inf)
+        self.nearest_index = np.full(len(self.candidates), -1, dtype=np.intp)
+
+        self.exclude(exclude_colors)
+
+    @property
+    def colors(self):
+        """
+        List of the (r,g,b) colours chosen so far, in the order they were added.
+        """
+        chosen = self._colors[: self.n_colors][~self._excluded[: self.n_colors]]
+        return [tuple(color) for color in chosen.tolist()]
+
+    @property
+    def exclude_colors(self):
+        """
+        List of the (r,g,b) colours that chosen colours are distinct from.
+        """
+        excluded = self._colors[: self.n_colors][self._excluded[: self.n_colors]]
+        return [tuple(color) for color in excluded.tolist()]
+
+    def _append(self, colors, compare_colors, excluded):
+        """
+        Add colours to the arrays of colours, growing them if needed, and update the
+        nearest distances of the candidates. Returns the index of the first new colour.
+        """
+        first = self.n_colors
+        n_new = first + len(colors)
+        if n_new > len(self._colors):
+            capacity = max(n_new, 2 * len(self._colors))
+            for attr in ["_colors", "_compare_colors", "_excluded"]:
+                old = getattr(self, attr)
+                grown = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:first] = old[:first]
+                setattr(self, attr, grown)
+
+        self._colors[first:n_new] = colors
+        self._compare_colors[first:n_new] = compare_colors
+        self._excluded[first:n_new] = excluded
+        self.n_colors = n_new
+
+        nearest, index = _nearest_indices(
+            self.compare_candidates, compare_colors, self.metric
+        )
+        closer = nearest < self.nearest
+        self.nearest[closer] = nearest[closer]
+        self.nearest_index[closer] = first + index[closer]
+
+        return first
 
-    :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
-        be generated.
+    def add(self, n_colors=1):
+        """
+        Choose more colours, each as distinct as possible from the excluded and
+        previously chosen colours.
 
-    :param rng: A random integer seed or random.Random state.
-        If unspecified the global random is used.
+        :param n_colors: How many colours to add.
 
-    :return: color: a (r,g,b) tuple. r, g and b are values between 0 and 1.
+        :return: A list of the new (r,g,b) colours.
+        """
+        return [self.pick() for _ in range(n_colors)]
+
+    def _add_picked(self, idx, stats=None):
+        self._append(
+            self.candidates[idx : idx + 1].copy(),
+            self.compare_candidates[idx : idx + 1].copy(),
+            excluded=False,
+        )
+
+    def _update_nearest(self, idx, stats=None):
+        nearest, index = _nearest_indices(
+            self.compare_candidates[idx : idx + 1],
+            self._compare_colors[: self.n_colors],
+            self.metric,
+        )
+        self.nearest[idx] = nearest[0]
+        self.nearest_index[idx] = index[0]
+
+    def exclude(self, colors):
+        """
+        Exclude more colours, so that colours chosen from now on are distinct from
+        them. Colours that have already been chosen don't change.
+
+        :param colors: A list of (r,g,b) colours.
+        """
+        colors = np.array(colors, dtype=float).reshape(-1, 3)
+        if len(colors) > 0:
+            self._append(
+                colors,
+                _simulate_colors(colors, self.colorblind_type, metric=self.metric),
+                excluded=True,
+            )
+
+    def remove(self, color):
+        """
+        Remove a chosen or excluded colour, so that colours chosen from now on can be
+        close to it again.
+
+        :param color: The (r,g,b) colour to remove. If it was added more than once,
+            the first one is removed.
+
+        :raises ValueError: if color isn't a chosen or excluded colour.
+        """
+        matches = np.flatnonzero(
+            (self._colors[: self.n_colors] == np.asarray(color, dtype=float)).all(
+                axis=1
+            )
+        )
+        if len(matches) == 0:
+            raise ValueError(str(color) + " is not in the palette")
+        removed = int(matches[0])
+
+        for attr in ["_colors", "_compare_colors", "_excluded"]:
+            values = getattr(self, attr)
+            values[removed : self.n_colors - 1] = values[removed + 1 : self.n_colors]
+        self.n_colors -= 1
+
+        # only candidates whose nearest colour was removed need their distances again
+        affected = np.flatnonzero(self.nearest_index == removed)
+        self.nearest_index[self.nearest_index > removed] -= 1
+        nearest, index = _nearest_indices(
+            self.compare_candidates[affected],
+            self._compare_colors[: self.n_colors],
+            self.metric,
+        )
+        self.nearest[affected] = nearest
+        self.nearest_index[affected] = index
+
+
+def _report_pick(on_color, stats, index, color, start):
     """
-    rng = _ensure_rng(rng)
+    Complete the statistics for a colour picked by get_colors and pass them to
+    on_color.
+    """
+    stats["seconds"] = time.perf_counter() - start
+    stats["index"] = index
+    stats["color"] = color
+    on_color(stats)
 
-    color = [(rng.random() + pastel_factor) / (1.0 + pastel_factor) for _ in range(3)]
 
-    return tuple(color)
+@functools.lru_cache(maxsize=256)
+def _get_colors_memo(n_colors, exclude_colors, **kwargs):
+    """
+    get_colors for hashable arguments, with the new colours returned as a tuple.
+    """
+    return tuple(get_colors(n_colors, exclude_colors=list(exclude_colors), **kwargs))
 
 
-def color_distance(c1, c2):
+def get_colors_cached(
+    n_colors,
+    exclude_colors=None,
+    return_excluded=False,
+    pastel_factor=0.0,
+    n_attempts=1000,
+    colorblind_type=None,
+    rng=None,
+    incremental=False,
+    sampler="random",
+    refine_iterations=0,
+    metric="redmean",
+):
     """
-    Metric to define the visual distinction between two (r,g,b) colours.
-    Inspired by: https://www.compuphase.com/cmetric.htm
+    Memoized version of get_colors for seeded calls, which keeps the colours from the
+    256 most recently used combinations of arguments in memory. With an integer or
+    float rng seed the colours are a pure function of the arguments, so repeated calls
+    return the stored colours without generating them again.
 
-    :param c1: (r,g,b) colour tuples. r,g and b are values between 0 and 1.
+    exclude_colors may be given as any sequence of (r,g,b) colours, e.g. lists and
+    tuples of the same colours share a cache entry. Hit and miss counts are available
+    from get_colors_cached.cache_info(), and get_colors_cached.cache_clear() empties
+    the cache.
 
-    :param c2: (r,g,b) colour tuples. r,g and b are values between 0 and 1.
+    :param rng: An integer or float random seed (required).
 
-    :return: distance: float representing visual distinction between c1 and c2.
-        Larger values = more distinct.
+    The other parameters are the same as for get_colors.
+
+    :return: colors - A tuple of (r,g,b) tuples, as returned by get_colors but
+        immutable so that the cached result can't be modified.
     """
+    if not isinstance(rng, (int, float)):
+        raise TypeError("get_colors_cached needs an integer or float rng seed")
 
-    r1, g1, b1 = c1
-    r2, g2, b2 = c2
+    if exclude_colors is None:
+        exclude_colors = [WHITE, BLACK]
+    exclude_colors = tuple(tuple(float(x) for x in color) for color in exclude_colors)
+
+    colors = _get_colors_memo(
+        n_colors,
+        exclude_colors,
+        pastel_factor=pastel_factor,
+        n_attempts=n_attempts,
+        colorblind_type=colorblind_type,
+        rng=rng,
+        incremental=incremental,
+        sampler=sampler,
+        refine_iterations=refine_iterations,
+        metric=metric,
+    )
 
-    mean_r = (r1 + r2) / 2
-    delta_r = (r1 - r2) ** 2
-    delta_g = (g1 - g2) ** 2
-    delta_b = (b1 - b2) ** 2
+    if return_excluded:
+        return exclude_colors + colors
+    else:
+        return colors
 
-    distance = (2 + mean_r) * delta_r + 4 * delta_g + (3 - mean_r) * delta_b
 
-    return distance
+get_colors_cached.cache_info = _get_colors_memo.cache_info
+get_colors_cached.cache_clear = _get_colors_memo.cache_clear
 
 
-def distinct_color(
-    exclude_colors, pastel_factor=0.0, n_attempts=1000, colorblind_type=None, rng=None
+def refine_colors(
+    colors,
+    exclude_colors=None,
+    pastel_factor=0.0,
+    colorblind_type=None,
+    n_iterations=50,
+    step=0.05,
+    metric="redmean",
 ):
     """
-    Generate a colour as distinct as possible from the colours defined in exclude_colors
-    Inspired by: https://gist.github.com/adewes/5884820
+    Nudge colours apart to increase the smallest color_distance between them, e.g. to
+    improve colours generated by get_colors without increasing n_attempts.
 
-    :param exclude_colors: a list of (r,g,b) tuples. r,g,b are values between 0 and 1.
+    Each iteration visits the colours starting with the least distinct, and moves each
+    one a small step in whichever of the 26 directions (along the r, g and b axes and
+    diagonals) most increases the distance to its nearest neighbour, if any do. As
+    each move only increases the nearest distance of the colour being moved, the
+    smallest distance between any two colours never decreases. The step size is halved
+    whenever an iteration makes no moves.
 
-    :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
-        be generated.
+    :param colors: A list of (r,g,b) colours to refine.
 
-    :param n_attempts: number of random colours to generate to find most distinct colour
+    :param exclude_colors: A list of (r,g,b) colours that colors should be distinct
+        from, but that aren't moved. If None, exclude_colors will be set to avoid white
+        and black (exclude_colors=[(0,0,0), (1,1,1)]).
 
-    :param colorblind_type: Type of colourblindness to simulate, can be:
+    :param pastel_factor: float between 0 and 1. Refined colours are kept within the
+        range of colours generated with this pastel_factor, i.e. each of r, g and b
+        stays between pastel_factor / (1 + pastel_factor) and 1.
 
-        * 'Normal': Normal vision
-        * 'Protanopia': Red-green colorblindness (1% males)
-        * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
-        * 'Deuteranopia': Red-green colorblindness (1% males)
-        * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
-          0.4% females)
-        * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
-        * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
-        * 'Achromatopsia': Total colourblindness
-        * 'Achromatomaly': Total colourblindness
+    :param colorblind_type: If given, distances are measured between colours as they
+        appear with this type of colourblindness, see get_colors.
 
-    :param rng: A random integer seed or random.Random state.
-        If unspecified the global random is used.
+    :param n_iterations: Maximum number of passes over the colours.
 
-    :return: (r,g,b) color tuple of the generated colour with the largest minimum
-        color_distance to the colours in exclude_colors.
+    :param step: Initial size of the moves in each of r, g and b.
+
+    :param metric: How the distinction between colours is measured, see get_colors.
+
+    :return: A list of the refined (r,g,b) colours, in the same order as colors.
     """
-    rng = _ensure_rng(rng)
+    if exclude_colors is None:
+        exclude_colors = [WHITE, BLACK]
 
-    if not exclude_colors:
-        return get_random_color(pastel_factor=pastel_factor, rng=rng)
+    colors = np.array(colors, dtype=float).reshape(-1, 3)
+    if len(colors) == 0:
+        return []
 
-    if colorblind_type:
-        exclude_colors = [
-            colorblind.colorblind_filter(color, colorblind_type)
-            for color in exclude_colors
-        ]
-
-    max_distance = None
-    best_color = None
-
-    # try pre-defined corners, edges, interior points first
-    if pastel_factor == 0:
-        for color in POINTS_OF_INTEREST:
-            if color not in exclude_colors:
-                if colorblind_type:
-                    compare_color = colorblind.colorblind_filter(color, colorblind_type)
-                else:
-                    compare_color = color
-
-                distance_to_nearest = min(
-                    [color_distance(compare_color, c) for c in exclude_colors]
-                )
+    lower = pastel_factor / (1.0 + pastel_factor)
+    directions = np.array(
+        [d for d in itertools.product((0, -1, 1), repeat=3)], dtype=float
+    )
 
-                if (not max_distance) or (distance_to_nearest > max_distance):
-                    max_distance = distance_to_nearest
-                    best_color = color
+    compare_colors = _simulate_colors(colors, colorblind_type, metric=metric).copy()
+    compare_exclude = _simulate_colors(
+        np.array(exclude_colors, dtype=float).reshape(-1, 3),
+        colorblind_type,
+        metric=metric,
+    )
+    grid = _color_grid(compare_exclude, metric)
+
+    for _ in range(n_iterations):
+        nearest = _min_distances_to_others(compare_colors, metric)
+        if len(compare_exclude) > 0:
+            nearest = np.minimum(
+                nearest,
+                _nearest_distances(
+                    compare_colors, compare_exclude, grid=grid, metric=metric
+                ),
+            )
+
+        moved = False
+        for i in np.argsort(nearest, kind="stable"):
+            # the first proposal is the current colour
+            proposals = np.clip(colors[i] + step * directions, lower, 1.0)
+            compare_proposals = _simulate_colors(
+                proposals, colorblind_type, metric=metric
+            )
 
-    # try n_attempts randomly generated colours
-    for _ in range(n_attempts):
-        color = get_random_color(pastel_factor=pastel_factor, rng=rng)
+            distances = _color_distances(compare_proposals, compare_colors, metric)
+            distances[:, i] = np.inf
+            distances = distances.min(axis=1)
+            if len(compare_exclude) > 0:
+                distances = np.minimum(
+                    distances,
+                    _nearest_distances(
+                        compare_proposals, compare_exclude, grid=grid, metric=metric
+                    ),
+                )
 
-        if not exclude_colors:
-            return color
+            best = int(np.argmax(distances))
+            if distances[best] > distances[0]:
+                colors[i] = proposals[best]
+                compare_colors[i] = compare_proposals[best]
+                moved = True
 
-        else:
-            if colorblind_type:
-                compare_color = colorblind.colorblind_filter(color, colorblind_type)
-            else:
-                compare_color = color
+        if not moved:
+            step /= 2
 
-            distance_to_nearest = min(
-                [color_distance(compare_color, c) for c in exclude_colors]
-            )
+    return [tuple(color) for color in colors.tolist()]
 
-            if (not max_distance) or (distance_to_nearest > max_distance):
-                max_distance = distance_to_nearest
-                best_color = color
 
-    return tuple(best_color)
+def _get_colors_from_kwargs(kwargs):
+    """
+    Call get_colors with a dict of keyword arguments (used by get_colors_batch).
+    """
+    return get_colors(**kwargs)
 
 
-def get_text_color(background_color, threshold=0.6):
+def get_colors_batch(requests, workers=None, chunksize=None, rng=None):
     """
-    Choose whether black or white text will work better on top of background_color.
-    Inspired by: https://stackoverflow.com/a/3943023
+    Generate many independent lists of visually distinct colours, spreading them
+    across a pool of processes.
 
-    :param background_color: The colour the text will be displayed on
+    :param requests: A list of dicts of keyword arguments for get_colors, e.g.
+        [{"n_colors": 5}, {"n_colors": 10, "colorblind_type": "Deuteranomaly"}].
 
-    :param threshold: float between 0 and 1. With threshold close to 1 white text will
-        be chosen more often.
+    :param workers: Number of worker processes. If None, os.cpu_count() is used. If 1,
+        the requests are processed in the current process without a pool.
 
-    :return: (0,0,0) if black text should be used or (1,1,1) if white text should be
+    :param chunksize: Number of requests sent to a worker process at a time. If None,
+        the requests are split into roughly four chunks per worker.
+
+    :param rng: A random integer seed or random.Random state, used to give each
+        request that doesn't set its own "rng" a seed of its own. The seed for a
+        request only depends on rng and its position in requests, so results are
+        reproducible for any number of workers. If unspecified the global random is
         used.
+
+    :return: A list with the colours returned by get_colors for each request, in the
+        same order as requests.
     """
+    rng = _ensure_rng(rng)
 
-    r, g, b = background_color[0], background_color[1], background_color[2]
+    tasks = []
+    for request in requests:
+        seed = rng.randrange(_SEED_MAX)
+        kwargs = dict(request)
+        if kwargs.get("rng") is None:
+            kwargs["rng"] = seed
+        tasks.append(kwargs)
 
-    if (r * 0.299 + g * 0.587 + b * 0.114) > threshold:
-        return BLACK
-    else:
-        return WHITE
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
 
+    if workers == 1:
+        return [_get_colors_from_kwargs(kwargs) for kwargs in tasks]
 
-def get_colors(
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(tasks) / (4 * workers)))
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_get_colors_from_kwargs, tasks, chunksize=chunksize))
+
+
+def get_colors_multistart(
     n_colors,
+    restarts=8,
+    workers=1,
     exclude_colors=None,
     return_excluded=False,
     pastel_factor=0.0,
     n_attempts=1000,
     colorblind_type=None,
     rng=None,
+    incremental=False,
+    sampler="random",
+    refine_iterations=0,
+    metric="redmean",
 ):
     """
-    Generate a list of n visually distinct colours.
+    Generate n visually distinct colours several times with different seeds and keep
+    the most distinct result. The colours found by get_colors depend on its random
+    candidates, so the best of several independent runs is usually noticeably better
+    than a single run, especially for large n_colors.
 
     :param n_colors: How many colours to generate
 
+    :param restarts: Number of independent runs of get_colors, at least 1.
+
+    :param workers: Number of worker processes to spread the runs across, see
+        get_colors_batch. If 1 (default) the runs are done in the current process.
+
+    :param rng: A random integer seed or random.Random state, used to give each run
+        its own seed. If unspecified the global random is used.
+
+    The other parameters are the same as for get_colors.
+
+    :return: tuple of the colours from the best run, as returned by get_colors, and
+        its score: the smallest distance (measured with metric) between a generated
+        colour and any other generated or excluded colour (after applying the
+        colorblind_type filter).
+    """
+    if restarts < 1:
+        raise ValueError("restarts must be at least 1")
+    if exclude_colors is None:
+        exclude_colors = [WHITE, BLACK]
+
+    request = {
+        "n_colors": n_colors,
+        "exclude_colors": exclude_colors,
+        "pastel_factor": pastel_factor,
+        "n_attempts": n_attempts,
+        "colorblind_type": colorblind_type,
+        "incremental": incremental,
+        "sampler": sampler,
+        "refine_iterations": refine_iterations,
+        "metric": metric,
+    }
+    results = get_colors_batch([request] * restarts, workers=workers, rng=rng)
+
+    scores = [
+        _min_pairwise_distance(
+            colors,
+            colorblind_type=colorblind_type,
+            exclude_colors=exclude_colors,
+            metric=metric,
+        )
+        for colors in results
+    ]
+    best = int(np.argmax(scores))
+
+    colors = results[best]
+    if return_excluded:
+        colors = list(exclude_colors) + colors
+
+    return colors, scores[best]
+
+
+def get_colors_large(
+    n_colors,
+    exclude_colors=None,
+    pastel_factor=0.0,
+    colorblind_type=None,
+    grid_size=None,
+):
+    """
+    Generate a large number of visually distinct colours (e.g. thousands of labels in
+    a segmentation map), much faster than get_colors can at that scale.
+
+    Colours are chosen from a fixed lattice of grid_size^3 candidate colours by
+    farthest-point sampling: each new colour is the candidate with the largest
+    color_distance to its nearest excluded or chosen colour. The candidates are
+    bucketed into cells (after applying the colorblind_type filter), and as the
+    nearest distance of the new colour bounds how far away it can affect other
+    candidates, only the candidates in nearby cells are updated after each pick.
+    Only the redmean metric is supported.
+
+    :param n_colors: How many colours to generate, at most the number of candidates
+        that differ from all of exclude_colors (after the colorblind_type filter).
+
     :param exclude_colors: A list of (r,g,b) colours that new colours should be distinct
         from. If exclude_colors=None then exclude_colors will be set to avoid white
-        and black (exclude_colors=[(0,0,0), (1,1,1)]). (r,g,b) values should be floats
-        between 0 and 1.
-
-    :param return_excluded: If return_excluded=True then exclude_colors will be included
-        in the returned color list. Otherwise only the newly generated colors are
-        returned (default).
+        and black (exclude_colors=[(0,0,0), (1,1,1)]).
 
     :param pastel_factor: float between 0 and 1. If pastel_factor>0 paler colours will
         be generated.
 
-    :param n_attempts: number of random colours to generated to find most distinct
-        colour.
-
     :param colorblind_type: Generate colours that are distinct with given type of
-        colourblindness. Can be:
-
-            * 'Normal': Normal vision
-            * 'Protanopia': Red-green colorblindness (1% males)
-            * 'Protanomaly': Red-green colorblindness (1% males, 0.01% females)
-            * 'Deuteranopia': Red-green colorblindness (1% males)
-            * 'Deuteranomaly': Red-green colorblindness (most common type: 6% males,
-            0.4% females)
-            * 'Tritanopia': Blue-yellow colourblindness (<1% males and females)
-            * 'Tritanomaly' Blue-yellow colourblindness (0.01% males and females)
-            * 'Achromatopsia': Total colourblindness
-            * 'Achromatomaly': Total colourblindness
+        colourblindness, see get_colors.
 
-    :param rng: A random integer seed or random.Random state.
-        If unspecified the global random is used.
+    :param grid_size: Number of candidate values along each of r, g and b. If None,
+        a lattice with about eight candidates per colour is used (at least 16 and at
+        most 128 values per axis).
 
-    :return: colors - A list of (r,g,b) colors that are visually distinct to each other
-        and to the colours in exclude_colors. (r,g,b) values are floats between 0 and 1.
+    :return: (n_colors, 3) array of (r,g,b) colours, in the order they were chosen (so
+        the first k rows are also well separated from each other).
     """
-    rng = _ensure_rng(rng)
-
     if exclude_colors is None:
         exclude_colors = [WHITE, BLACK]
+    if grid_size is None:
+        grid_size = int(np.clip(np.ceil((8 * n_colors) ** (1 / 3)), 16, 128))
 
-    colors = exclude_colors.copy()
+    # not cached, as large lattices would stay in memory after the call
+    candidates, compare = _make_candidate_lattice(
+        pastel_factor, colorblind_type, grid_size
+    )
+
+    # sort the candidates into cells of about 128 candidates in the filtered space, so
+    # that the candidates in each cell and in each row of cells are contiguous
+    n_cells = max(1, int(round((len(candidates) / 128) ** (1 / 3))))
+    lo = compare.min(axis=0)
+    scale = n_cells / np.maximum(compare.max(axis=0) - lo, 1e-12)
+    cell = np.clip(((compare - lo) * scale).astype(np.intp), 0, n_cells - 1)
+    cell_id = (cell[:, 0] * n_cells + cell[:, 1]) * n_cells + cell[:, 2]
+    order = np.argsort(cell_id, kind="stable")
+    candidates = candidates[order]
+    compare = compare[order]
+    starts = np.searchsorted(cell_id[order], np.arange(n_cells**3))
+    ends = np.append(starts[1:], len(candidates))
+
+    nearest = np.full(len(candidates), np.inf)
+    if len(exclude_colors) > 0:
+        compare_exclude = _simulate_colors(
+            np.array(exclude_colors, dtype=float).reshape(-1, 3), colorblind_type
+        )
+        nearest = _nearest_distances(
+            compare, compare_exclude, grid=_color_grid(compare_exclude)
+        )
+
+    # candidates matching an excluded colour can never be chosen
+    n_available = int(np.count_nonzero(nearest > 0))
+    if n_colors > n_available:
+        raise ValueError(
+            "n_colors must be at most the number of candidates distinct from "
+            "exclude_colors = " + str(n_available)
+        )
+
+    # largest nearest distance in each cell, -inf for empty cells
+    cell_max = np.full(n_cells**3, -np.inf)
+    nonempty = ends > starts
+    cell_max[nonempty] = np.maximum.reduceat(nearest, starts[nonempty])
 
+    # smallest weights of the squared r, g and b differences in color_distance between
+    # any two candidates, so that a distance below D implies a difference below
+    # sqrt(D / weight) along each axis
+    weights = np.array([2 + compare[:, 0].min(), 4, 3 - compare[:, 0].max()])
+
+    # the filtered r, g and b values as contiguous arrays
+    red, green, blue = compare.T.copy()
+
+    picked = np.empty(n_colors, dtype=np.intp)
     for i in range(n_colors):
-        colors.append(
-            distinct_color(
-                colors,
-                pastel_factor=pastel_factor,
-                n_attempts=n_attempts,
-                colorblind_type=colorblind_type,
-                rng=rng,
+        best_cell = int(np.argmax(cell_max))
+        start, end = starts[best_cell], ends[best_cell]
+        idx = start + int(np.argmax(nearest[start:end]))
+        if not nearest[idx] > 0:
+            # remaining candidates all look the same as a chosen or excluded colour
+            # after the colorblind_type filter
+            raise ValueError(
+                "Only " + str(i) + " distinct colours could be chosen from a lattice "
+                "with grid_size=" + str(grid_size)
             )
-        )
+        picked[i] = idx
+
+        # only candidates closer to the new colour than nearest[idx] can change, and
+        # they're all in the box of cells around it
+        r, g, b = compare[idx].tolist()
+        if np.isfinite(nearest[idx]) and weights.min() > 0:
+            reach = np.sqrt(nearest[idx] / weights)
+            box_lo = np.maximum(((compare[idx] - reach - lo) * scale).astype(int), 0)
+            box_hi = np.minimum(
+                ((compare[idx] + reach - lo) * scale).astype(int), n_cells - 1
+            )
+            (x_lo, y_lo, z_lo), (x_hi, y_hi, z_hi) = box_lo.tolist(), box_hi.tolist()
+        else:
+            x_lo = y_lo = z_lo = 0
+            x_hi = y_hi = z_hi = n_cells - 1
 
-    if return_excluded:
-        return colors
-    else:
-        return colors[len(exclude_colors) :]
+        # cells in the box, in order, and the candidates in them
+        rows = np.arange(x_lo, x_hi + 1)[:, np.newaxis] * n_cells
+        rows = (rows + np.arange(y_lo, y_hi + 1)) * n_cells + z_lo
+        box = (rows.reshape(-1, 1) + np.arange(z_hi - z_lo + 1)).ravel()
+        counts = ends[box] - starts[box]
+        offsets = np.cumsum(counts) - counts
+        members = np.repeat(starts[box] - offsets, counts) + np.arange(counts.sum())
+
+        # color_distance from each candidate to the new colour
+        mean_r = (red[members] + r) / 2
+        distances = (2 + mean_r) * (red[members] - r) ** 2
+        distances += 4 * (green[members] - g) ** 2
+        distances += (3 - mean_r) * (blue[members] - b) ** 2
+
+        np.minimum(nearest[members], distances, out=distances)
+        nearest[members] = distances
+        nonempty = counts > 0
+        cell_max[box[nonempty]] = np.maximum.reduceat(distances, offsets[nonempty])
+
+    return candidates[picked]
 
 
 def invert_colors(colors):
@@ -457,14 +2419,107 @@ def color_swatch(
         plt.show()
 
 
+def rgb_to_uint8(colors):
+    """
+    Convert 0.0-1.0 rgb colours into 0-255 integer rgb colours, rounding halves to even
+    like get_rgb256 and matplotlib.
+
+    :param colors: An (r,g,b) colour or a list or (..., 3) array of (r,g,b) colours,
+        with r, g and b floats between 0.0 and 1.0.
+
+    :return: uint8 array with the same shape as colors.
+    """
+    colors = np.asarray(colors, dtype=float)
+    if not ((colors >= 0) & (colors <= 1)).all():
+        raise ValueError("rgb values must be between 0 and 1")
+
+    return np.round(colors * 255).astype(np.uint8)
+
+
+def uint8_to_rgb(values):
+    """
+    Convert 0-255 integer rgb colours into 0.0-1.0 rgb colours.
+
+    :param values: An (r,g,b) colour or a list or (..., 3) array of (r,g,b) colours,
+        with r, g and b integers between 0 and 255.
+
+    :return: float array with the same shape as values.
+    """
+    values = np.asarray(values)
+    if not ((values >= 0) & (values <= 255)).all():
+        raise ValueError("rgb values must be between 0 and 255")
+
+    return values.astype(np.uint8) / 255.0
+
+
+# ASCII codes of the hexadecimal digits
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+
+def rgb_to_hex(colors):
+    """
+    Convert rgb colours into hex strings, without needing matplotlib.
+
+    :param colors: An (r,g,b) colour or a list or (n, 3) array of (r,g,b) colours,
+        with r, g and b floats between 0.0 and 1.0.
+
+    :return: A "#rrggbb" hex string if colors is a single colour, otherwise a list of
+        them.
+    """
+    values = rgb_to_uint8(colors)
+    single = values.shape == (3,)
+    values = values.reshape(-1, 3)
+
+    chars = np.empty((len(values), 7), dtype=np.uint8)
+    chars[:, 0] = ord("#")
+    chars[:, 1::2] = _HEX_DIGITS[values >> 4]
+    chars[:, 2::2] = _HEX_DIGITS[values & 15]
+    hex_colors = chars.view("S7").ravel().astype(str).tolist()
+
+    return hex_colors[0] if single else hex_colors
+
+
+def hex_to_rgb(hex_colors):
+    """
+    Convert hex strings into rgb colours, without needing matplotlib.
+
+    :param hex_colors: A "#rrggbb" (or "rrggbb") hex string or a list of them.
+
+    :return: A float array of shape (3,) if hex_colors is a single string, otherwise
+        of shape (n, 3), with values between 0.0 and 1.0.
+    """
+    single = isinstance(hex_colors, str)
+    if single:
+        hex_colors = [hex_colors]
+
+    digits = [h[1:] if h.startswith("#") else h for h in hex_colors]
+    if any(len(h) != 6 for h in digits):
+        raise ValueError("hex colours must have the form #rrggbb")
+    values = np.frombuffer(bytes.fromhex("".join(digits)), dtype=np.uint8)
+
+    colors = uint8_to_rgb(values.reshape(-1, 3))
+
+    return colors[0] if single else colors
+
+
 def get_hex(color):
     """
     Returns hex of given color
 
-    :param color: (r,g,b) color tuple. r,g,b are floats between 0 and 1.
+    :param color: (r,g,b) color tuple. r,g,b are floats between 0 and 1. Any other
+        color specification understood by matplotlib (e.g. "red") is passed on to
+        matplotlib.colors.rgb2hex.
 
     :return: hex str of color
     """
+    try:
+        values = np.asarray(color, dtype=float)
+    except (TypeError, ValueError):
+        values = None
+
+    if values is not None and values.ndim == 1 and len(values) in (3, 4):
+        return rgb_to_hex(values[:3])
+
     import matplotlib.colors
 
     return matplotlib.colors.rgb2hex(color)
@@ -501,3 +2556,101 @@ def get_colormap(list_of_colors, name="distinctipy"):
     cmap = matplotlib.colors.ListedColormap(list_of_colors, name=name)
 
     return cmap
+
+
+def _label_index(label_ids):
+    """
+    Build a function mapping an array of labels to their positions in label_ids (or
+    -1 for labels that aren't in label_ids). Labels are looked up in a dense table if
+    the range of label_ids isn't too sparse, or else by binary search.
+    """
+    label_ids = np.asarray(label_ids).ravel()
+    if len(label_ids) == 0:
+        return lambda labels: np.full(labels.shape, -1, dtype=np.intp)
+
+    lowest = int(label_ids.min())
+    span = int(label_ids.max()) - lowest + 1
+    if span <= max(2**16, 4 * len(label_ids)):
+        table = np.full(span, -1, dtype=np.intp)
+        table[label_ids - lowest] = np.arange(len(label_ids))
+
+        def index(labels):
+            if labels.min() >= lowest and labels.max() < lowest + span:
+                return table[labels.astype(np.intp) - lowest]
+
+            offsets = labels.astype(np.int64) - lowest
+            valid = (offsets >= 0) & (offsets < span)
+            return np.where(valid, table[np.where(valid, offsets, 0)], -1)
+
+        return index
+
+    order = np.argsort(label_ids, kind="stable")
+    sorted_ids = label_ids[order]
+
+    def index(labels):
+        position = np.minimum(np.searchsorted(sorted_ids, labels), len(sorted_ids) - 1)
+        return np.where(sorted_ids[position] == labels, order[position], -1)
+
+    return index
+
+
+def colorize_labels(labels, palette, out=None, chunk=2**22, label_ids=None):
+    """
+    Colour an array of integer labels (e.g. a segmentation or clustering label map)
+    with a palette, processing it in chunks so that memory use stays bounded.
+
+    :param labels: Integer array of labels, of any shape. Can be an np.memmap.
+
+    :param palette: A list or (n, 3) array of (r,g,b) colours, either floats between
+        0 and 1 (e.g. from get_colors) or uint8 values.
+
+    :param out: uint8 array of shape labels.shape + (3,) to write the colours to, for
+        example a preallocated array or np.memmap. If None a new array is created.
+
+    :param chunk: Maximum number of labels to colour at a time. Labels are processed
+        in blocks along their first axis.
+
+    :param label_ids: Optional list of the label for each colour in palette, e.g. to
+        colour sparse label IDs. If None, label i is coloured with palette[i].
+
+    :return: uint8 array of shape labels.shape + (3,) with the colour of each label.
+        This is out if it was given.
+    """
+    labels = np.asarray(labels)
+    if not np.issubdtype(labels.dtype, np.integer):
+        raise ValueError("labels must have an integer dtype")
+    if labels.ndim == 0:
+        raise ValueError("labels must have at least one dimension")
+
+    palette = np.asarray(palette)
+    if palette.dtype != np.uint8:
+        palette = rgb_to_uint8(palette)
+    palette = palette.reshape(-1, 3)
+
+    if label_ids is None:
+        index = _label_index(np.arange(len(palette)))
+    elif len(label_ids) != len(palette):
+        raise ValueError("label_ids must have one label for each colour in palette")
+    else:
+        index = _label_index(label_ids)
+
+    shape = labels.shape + (3,)
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif out.shape != shape or out.dtype != np.uint8:
+        raise ValueError(
+            "out should be a uint8 array with shape {}, not a {} array with shape "
+            "{}".format(shape, out.dtype, out.shape)
+        )
+
+    rows_per_chunk = max(1, chunk // max(1, math.prod(labels.shape[1:])))
+    for start in range(0, len(labels), rows_per_chunk):
+        block = labels[start : start + rows_per_chunk]
+        positions = index(block)
+        if (positions < 0).any():
+            missing = block[positions < 0].flat[0]
+            raise ValueError("label {} has no colour in palette".format(missing))
+
+        np.take(palette, positions, axis=0, out=out[start : start + rows_per_chunk])
+
+    return out
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from distinctipy import colorblind
+
+
+def test_colorblind_filter_array_matches_scalar():
+    """Assert filtering an array of colours gives the same result as filtering each
+    colour individually, for every type of colourblindness."""
+    rng = np.random.default_rng(0)
+    colors = np.concatenate(
+        [rng.random((500, 3)), [[0, 0, 0], [1, 1, 1], [1, 0, 0], [0.5, 0.5, 0.5]]]
+    )
+
+    for colorblind_type in colorblind.fBlind:
+        filtered = colorblind.colorblind_filter(colors, colorblind_type)
+        expected = [
+            colorblind.colorblind_filter(tuple(c), colorblind_type)
+            for c in colors.tolist()
+        ]
+        assert filtered.shape == colors.shape
+        np.testing.assert_allclose(filtered, expected, rtol=0, atol=1e-6)
+
+
+def test_colorblind_filter_array_keeps_shape():
+    """Assert arrays with extra dimensions, e.g. images, keep their shape."""
+    image = np.random.default_rng(1).random((4, 5, 3))
+    filtered = colorblind.colorblind_filter(image, "Protanopia")
+    assert filtered.shape == image.shape
+    np.testing.assert_allclose(
+        filtered[2, 3], colorblind.colorblind_filter(tuple(image[2, 3]), "Protanopia")
+    )
+
+    # rgba arrays are filtered like rgba tuples, dropping alpha
+    rgba = np.random.default_rng(1).random((6, 4))
+    filtered = colorblind.colorblind_filter(rgba, "Deuteranomaly")
+    assert filtered.shape == (6, 3)
+    np.testing.assert_allclose(
+        filtered[4], colorblind.colorblind_filter(tuple(rgba[4]), "Deuteranomaly")
+    )
+
+
+def test_filter_image():
+    """Assert filter_image matches colorblind_filter, independent of chunk size, and
+    writes to integer out buffers."""
+    image = np.random.default_rng(2).random((37, 11, 4))
+    expected = colorblind.colorblind_filter(image[:, :, :3], "Deuteranomaly")
+
+    filtered = colorblind.filter_image(image, "Deuteranomaly", chunk_rows=5)
+    np.testing.assert_allclose(filtered, expected)
+
+    out = np.zeros((37, 11, 3), dtype=np.uint8)
+    result = colorblind.filter_image(image, "Deuteranomaly", out=out, chunk_rows=8)
+    assert result is out
+    np.testing.assert_array_equal(out, np.rint(expected * 255))
+
+    uint8_image = (image * 255).astype(np.uint8)
+    np.testing.assert_allclose(
+        colorblind.filter_image(uint8_image, "Normal"), uint8_image[:, :, :3] / 255
+    )
+
+    with pytest.raises(ValueError):
+        colorblind.filter_image(image, "Deuteranomaly", chunk_rows=0)
+
+
+def test_lut(tmp_path):
+    """Assert lookup tables are cached, reproduce the exact filter at grid points,
+    interpolate accurately elsewhere and survive a save/load round trip."""
+    lut = colorblind.get_lut("Protanomaly", size=9)
+    assert lut.shape == (9, 9, 9, 3)
+    assert colorblind.get_lut("Protanomaly", size=9) is lut
+
+    grid_colors = np.array([[0, 0.25, 1], [0.5, 0.75, 0.125], [1, 1, 1]])
+    np.testing.assert_allclose(
+        colorblind.apply_lut(grid_colors, lut),
+        colorblind.colorblind_filter(grid_colors, "Protanomaly"),
+        atol=1e-6,
+    )
+
+    error = colorblind.lut_error("Protanomaly", size=33, n_samples=10000)
+    assert error["mean"] < 1e-3 and error["max"] < 0.2
+
+    image = np.random.default_rng(3).random((20, 30, 3))
+    np.testing.assert_allclose(
+        colorblind.filter_image(image, "Protanomaly", lut_size=33),
+        colorblind.filter_image(image, "Protanomaly"),
+        atol=0.2,
+    )
+
+    path = tmp_path / "protanomaly.npz"
+    colorblind.save_lut(path, "Protanomaly", size=9)
+    colorblind._LUTS.clear()
+    loaded = colorblind.load_lut(path)
+    np.testing.assert_array_equal(loaded, lut)
+    assert colorblind.get_lut("Protanomaly", size=9) is loaded
@@ -1,3 +1,9 @@
+import itertools
+import pickle
+
+import numpy as np
+import pytest
+
 import distinctipy
 
 
@@ -230,3 +236,566 @@ def test_ensure_rng():
     assert _ensure_rng(1) is not rng
     assert _ensure_rng(None) is not rng
     assert _ensure_rng(None) is random._inst
+
+
+def test_distinct_color_matches_scalar_distances():
+    """Assert the vectorised candidate scoring picks the candidate with the largest
+    scalar color_distance to its nearest excluded colour."""
+    from distinctipy.distinctipy import _RandomSampler
+
+    exclude = distinctipy.get_colors(8, rng=42)
+    pastel_factor = 0.3
+    color = distinctipy.distinct_color(
+        exclude, pastel_factor=pastel_factor, n_attempts=200, rng=5
+    )
+
+    candidates = _RandomSampler(pastel_factor=pastel_factor, rng=5).sample(200)
+    scores = [
+        min(distinctipy.color_distance(tuple(c), e) for e in exclude)
+        for c in candidates
+    ]
+    expected = tuple(candidates[scores.index(max(scores))].tolist())
+    assert color == expected
+    assert all(isinstance(x, float) for x in color)
+
+
+def test_get_colors_incremental():
+    """Assert incremental generation returns the requested number of valid, unique
+    colours, is reproducible and agrees with the default mode on the first pick."""
+    colors = distinctipy.get_colors(50, rng=3, incremental=True)
+    assert len(colors) == 50 and all([is_valid_color(c) for c in colors])
+    assert len(set(colors)) == 50
+    assert colors == distinctipy.get_colors(50, rng=3, incremental=True)
+    assert colors[0] == distinctipy.get_colors(1, rng=3)[0]
+
+    pastel = distinctipy.get_colors(
+        10, pastel_factor=0.7, colorblind_type="Tritanopia", rng=3, incremental=True
+    )
+    assert all([min(c) >= 0.7 / 1.7 for c in pastel])
+
+
+def test_get_colors_matches_distinct_color_loop():
+    """Assert get_colors, which caches the colourblind-filtered colours between
+    iterations, gives the same colours as repeatedly calling distinct_color."""
+    import random
+
+    for colorblind_type in [None, "Deuteranomaly", "Tritanopia"]:
+        colors = distinctipy.get_colors(
+            6, colorblind_type=colorblind_type, n_attempts=100, rng=21
+        )
+
+        rng = random.Random(21)
+        expected = [distinctipy.WHITE, distinctipy.BLACK]
+        for _ in range(6):
+            expected.append(
+                distinctipy.distinct_color(
+                    expected,
+                    colorblind_type=colorblind_type,
+                    n_attempts=100,
+                    rng=rng,
+                )
+            )
+        assert colors == expected[2:]
+
+
+def test_get_colors_batch():
+    """Assert batches give results in input order, that match get_colors, and that
+    are reproducible for any number of workers."""
+    requests = [
+        {"n_colors": 3},
+        {"n_colors": 5, "pastel_factor": 0.5},
+        {"n_colors": 4, "colorblind_type": "Deuteranomaly", "rng": 99},
+        {"n_colors": 2, "exclude_colors": [(0.5, 0.5, 0.5)], "n_attempts": 50},
+    ]
+    serial = distinctipy.get_colors_batch(requests, workers=1, rng=8)
+    parallel = distinctipy.get_colors_batch(requests, workers=2, chunksize=1, rng=8)
+
+    assert serial == parallel
+    assert [len(colors) for colors in serial] == [3, 5, 4, 2]
+    assert serial[2] == distinctipy.get_colors(
+        4, colorblind_type="Deuteranomaly", rng=99
+    )
+    assert serial != distinctipy.get_colors_batch(requests, workers=1, rng=9)
+
+
+def test_color_grid_nearest_is_exact():
+    """Assert the grid index of large exclude sets gives exactly the same nearest
+    distances as comparing against every colour."""
+    from distinctipy.distinctipy import _ColorGrid, _nearest_distances
+
+    rng = np.random.default_rng(4)
+    points = np.concatenate([rng.random((300, 3)), [[0, 0, 0], [1, 1, 1]]])
+    uniform = rng.random((20000, 3))
+    clustered = np.clip(rng.normal(0.3, 0.05, (20000, 3)), 0, 1)
+
+    for colors in [uniform, clustered]:
+        grid = _ColorGrid(colors)
+        queries = np.concatenate([points, colors[:10]])
+        np.testing.assert_array_equal(
+            grid.nearest(queries), _nearest_distances(queries, colors)
+        )
+
+
+def test_distinct_color_large_exclude(monkeypatch):
+    """Assert indexing large exclude sets doesn't change the colours generated."""
+    from distinctipy import distinctipy as dp
+
+    exclude = [tuple(c) for c in np.random.default_rng(5).random((5000, 3)).tolist()]
+    indexed = distinctipy.get_colors(3, exclude_colors=exclude, rng=6)
+
+    monkeypatch.setattr(dp, "_GRID_MIN_COLORS", len(exclude) + 1)
+    assert indexed == distinctipy.get_colors(3, exclude_colors=exclude, rng=6)
+
+
+def test_samplers():
+    """Assert the low-discrepancy samplers give valid, reproducible colours that
+    respect pastel_factor, and that the Sobol sampler is evenly stratified."""
+    from distinctipy.distinctipy import _SobolSampler
+
+    for sampler in ["random", "halton", "sobol"]:
+        colors = distinctipy.get_colors(
+            10, pastel_factor=0.5, sampler=sampler, n_attempts=64, rng=12
+        )
+        assert all([is_valid_color(c) and min(c) >= 0.5 / 1.5 for c in colors])
+        assert colors == distinctipy.get_colors(
+            10, pastel_factor=0.5, sampler=sampler, n_attempts=64, rng=12
+        )
+        assert is_valid_color(distinctipy.distinct_color([], sampler=sampler))
+
+    # each of the 4x4x4 sub-cubes contains exactly one of the first 64 points
+    points = _SobolSampler(rng=1).sample(64)
+    assert len(set(map(tuple, (points * 4).astype(int)))) == 64
+
+    with pytest.raises(ValueError):
+        distinctipy.get_colors(2, sampler="grid")
+
+
+def test_lattice_sampler_cache():
+    """Assert the lattice sampler reuses cached, read-only candidate arrays keyed by
+    pastel_factor, colorblind_type and size."""
+    from distinctipy.distinctipy import _candidate_lattice
+
+    _candidate_lattice.cache_clear()
+    colors = distinctipy.get_colors(
+        8, pastel_factor=0.2, colorblind_type="Protanopia", sampler="lattice", rng=1
+    )
+    assert all([is_valid_color(c) for c in colors])
+    assert _candidate_lattice.cache_info().misses == 1
+    assert _candidate_lattice.cache_info().hits == 7
+
+    candidates, compare = _candidate_lattice(0.2, "Protanopia", 10)
+    assert candidates.shape == (1000, 3) and compare.shape == (1000, 3)
+    assert not candidates.flags.writeable and not compare.flags.writeable
+    assert candidates.min() == 0.2 / 1.2
+
+    incremental = distinctipy.get_colors(
+        20, sampler="lattice", n_attempts=27, incremental=True, rng=1
+    )
+    assert len(set(incremental)) == 20
+
+
+def test_get_colors_multistart():
+    """Assert the multi-start search returns the best of its runs, reproducibly."""
+    from distinctipy.distinctipy import _min_pairwise_distance
+
+    colors, score = distinctipy.get_colors_multistart(
+        12, restarts=4, n_attempts=100, rng=17
+    )
+    assert len(colors) == 12 and all([is_valid_color(c) for c in colors])
+    assert score == _min_pairwise_distance(
+        colors, exclude_colors=[distinctipy.WHITE, distinctipy.BLACK]
+    )
+
+    exclude = [distinctipy.WHITE, distinctipy.BLACK]
+    runs = distinctipy.get_colors_batch(
+        [{"n_colors": 12, "n_attempts": 100}] * 4, workers=1, rng=17
+    )
+    assert colors in runs
+    assert score == max(_min_pairwise_distance(r, exclude_colors=exclude) for r in runs)
+
+    parallel = distinctipy.get_colors_multistart(
+        12, restarts=4, workers=2, n_attempts=100, rng=17
+    )
+    assert parallel == (colors, score)
+
+    with pytest.raises(ValueError):
+        distinctipy.get_colors_multistart(12, restarts=0)
+
+
+def test_refine_colors():
+    """Assert refinement doesn't make colours less distinct, keeps them within the
+    pastel_factor bounds and doesn't move excluded colours."""
+    from distinctipy.distinctipy import _min_pairwise_distance
+
+    exclude = [distinctipy.WHITE, distinctipy.BLACK, (0.2, 0.6, 0.4)]
+    for pastel_factor, colorblind_type in [(0.0, None), (0.4, "Deuteranomaly")]:
+        colors = distinctipy.get_colors(
+            15,
+            exclude_colors=exclude,
+            pastel_factor=pastel_factor,
+            colorblind_type=colorblind_type,
+            n_attempts=100,
+            rng=2,
+        )
+        refined = distinctipy.refine_colors(
+            colors,
+            exclude_colors=exclude,
+            pastel_factor=pastel_factor,
+            colorblind_type=colorblind_type,
+            n_iterations=10,
+        )
+
+        assert len(refined) == 15
+        assert all([min(c) >= pastel_factor / (1 + pastel_factor) for c in refined])
+        assert all([is_valid_color(c) for c in refined])
+        before = _min_pairwise_distance(colors, colorblind_type, exclude)
+        after = _min_pairwise_distance(refined, colorblind_type, exclude)
+        assert after > before
+
+    with_excluded = distinctipy.get_colors(
+        5, exclude_colors=exclude, return_excluded=True, refine_iterations=5, rng=2
+    )
+    assert with_excluded[:3] == exclude
+
+
+def test_get_colors_on_color():
+    """Assert on_color reports stats for each pick without changing the colours"""
+    for incremental in [False, True]:
+        picks = []
+        colors = distinctipy.get_colors(
+            5,
+            n_attempts=100,
+            colorblind_type="Deuteranomaly",
+            rng=4,
+            incremental=incremental,
+            on_color=picks.append,
+        )
+
+        # stats don't change the colours
+        assert colors == distinctipy.get_colors(
+            5,
+            n_attempts=100,
+            colorblind_type="Deuteranomaly",
+            rng=4,
+            incremental=incremental,
+        )
+        assert [pick["index"] for pick in picks] == list(range(5))
+        assert [pick["color"] for pick in picks] == colors
+        for pick in picks:
+            assert pick["candidates"] >= 100
+            assert pick["distance_evaluations"] >= 100
+            assert pick["filtered_colors"] > 0
+            assert pick["seconds"] >= 0
+            assert 0 < pick["nearest_distance"] < float("inf")
+
+
+def test_get_colors_cache_dir(tmp_path, monkeypatch):
+    """Assert seeded palettes are cached in cache_dir and evicted beyond a limit"""
+    kwargs = dict(n_attempts=100, colorblind_type="Deuteranomaly", rng=5)
+    expected = distinctipy.get_colors(6, **kwargs)
+
+    assert distinctipy.get_colors(6, cache_dir=tmp_path, **kwargs) == expected
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # second call is read from the cache without generating any colours
+    picks = []
+    cached = distinctipy.get_colors(
+        6, cache_dir=tmp_path, on_color=picks.append, return_excluded=True, **kwargs
+    )
+    assert cached == [distinctipy.WHITE, distinctipy.BLACK] + expected
+    assert picks == []
+
+    # unseeded calls aren't cached
+    distinctipy.get_colors(3, n_attempts=10, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+
+    # least recently used palettes are evicted beyond the size limit
+    monkeypatch.setattr(distinctipy.distinctipy, "_PALETTE_CACHE_MAX_BYTES", 300)
+    for n_colors in range(1, 6):
+        distinctipy.get_colors(n_colors, n_attempts=10, rng=1, cache_dir=tmp_path)
+    assert sum(f.stat().st_size for f in tmp_path.glob("*.npy")) <= 300
+
+
+def test_get_colors_cached():
+    """Assert get_colors_cached memoises get_colors for equivalent arguments"""
+    distinctipy.get_colors_cached.cache_clear()
+    exclude = [(1, 1, 1), (0, 0, 0), (0.5, 0.2, 0.1)]
+
+    colors = distinctipy.get_colors_cached(4, exclude_colors=exclude, rng=3)
+    assert colors == tuple(distinctipy.get_colors(4, exclude_colors=exclude, rng=3))
+    assert distinctipy.get_colors_cached.cache_info().misses == 1
+
+    # tuples of floats hit the same cache entry as lists of ints
+    same = distinctipy.get_colors_cached(
+        4, exclude_colors=tuple(tuple(map(float, c)) for c in exclude), rng=3
+    )
+    assert same is colors
+    assert distinctipy.get_colors_cached.cache_info().hits == 1
+
+    with_excluded = distinctipy.get_colors_cached(
+        4, exclude_colors=exclude, return_excluded=True, rng=3
+    )
+    assert with_excluded[3:] == colors
+    assert distinctipy.get_colors_cached.cache_info().hits == 2
+
+    with pytest.raises(TypeError):
+        distinctipy.get_colors_cached(4)
+
+
+def test_colorsets_as_array():
+    """Assert colorsets can be loaded as read-only arrays matching the lists"""
+    from distinctipy import colorsets
+
+    for name in colorsets.list_colorsets():
+        array = colorsets.get_colors(name, as_array=True)
+        assert array.shape == (200, 3)
+        assert not array.flags.writeable
+        assert colorsets.get_colors(name) == [tuple(c) for c in array.tolist()]
+
+    assert colorsets.colors["normal"] == colorsets.get_colors("normal")
+    assert list(colorsets.colors) == ["normal", "deuteranomaly"]
+
+
+def test_iter_colors():
+    """Assert iter_colors matches incremental get_colors and resumes after pickling"""
+    kwargs = dict(n_attempts=100, colorblind_type="Tritanopia", rng=6, sampler="halton")
+    expected = distinctipy.get_colors(8, incremental=True, **kwargs)
+
+    colors = distinctipy.iter_colors(**kwargs)
+    first = [next(colors) for _ in range(3)]
+
+    # resume from a pickled copy of the iterator
+    resumed = pickle.loads(pickle.dumps(colors))
+    assert first + list(itertools.islice(resumed, 5)) == expected
+    assert first + list(itertools.islice(colors, 5)) == expected
+
+
+def test_palette_builder():
+    """Assert PaletteBuilder keeps its cached distances correct as colours change"""
+    from distinctipy.distinctipy import _nearest_indices
+
+    kwargs = dict(n_attempts=200, colorblind_type="Deuteranomaly", rng=7)
+    palette = distinctipy.PaletteBuilder(**kwargs)
+    assert palette.add(6) == distinctipy.get_colors(6, incremental=True, **kwargs)
+
+    removed = palette.colors[2]
+    palette.remove(removed)
+    palette.exclude([(0.5, 0.5, 0.5), (0.2, 0.8, 0.2)])
+    new = palette.add(2)
+
+    assert removed not in palette.colors
+    assert palette.colors[-2:] == new
+    assert len(palette.colors) == 7
+    assert palette.exclude_colors == [
+        distinctipy.WHITE,
+        distinctipy.BLACK,
+        (0.5, 0.5, 0.5),
+        (0.2, 0.8, 0.2),
+    ]
+
+    # the cached distances match recomputing them from scratch
+    nearest, index = _nearest_indices(
+        palette.compare_candidates, palette._compare_colors[: palette.n_colors]
+    )
+    assert (palette.nearest == nearest).all()
+    assert (palette.nearest_index == index).all()
+
+    with pytest.raises(ValueError):
+        palette.remove(removed)
+
+
+def test_perceptual_metrics():
+    """Assert the CIELAB metrics match reference values and generate valid colours"""
+    from distinctipy.distinctipy import _paired_ciede2000_distances, _srgb_to_lab
+
+    lab = _srgb_to_lab(np.array([distinctipy.WHITE, distinctipy.RED]))
+    assert np.allclose(lab, [[100, 0, 0], [53.24, 80.09, 67.20]], atol=0.01)
+
+    # test data from Sharma, Wu and Dalal (2005)
+    pairs = np.array(
+        [
+            [[50.0, 2.6772, -79.7751], [50.0, 0.0, -82.7485]],
+            [[50.0, 3.1571, -77.2803], [50.0, 0.0, -82.7485]],
+            [[50.0, 0.0, 0.0], [50.0, -1.0, 2.0]],
+            [[50.0, 2.5, 0.0], [73.0, 25.0, -18.0]],
+            [[60.2574, -34.0099, 36.2677], [60.4626, -34.1751, 39.4387]],
+        ]
+    )
+    expected = [2.0425, 2.8615, 2.3669, 27.1492, 1.2644]
+    distances = _paired_ciede2000_distances(pairs[:, 0], pairs[:, 1])
+    assert np.allclose(distances, expected, atol=1e-4)
+
+    for metric in ["cie76", "cie94", "ciede2000"]:
+        assert distinctipy.color_distance((0.2, 0.4, 0.6), (0.2, 0.4, 0.6), metric) == 0
+        colors = distinctipy.get_colors(
+            6, n_attempts=200, colorblind_type="Deuteranomaly", rng=8, metric=metric
+        )
+        assert len(colors) == 6
+        assert all([is_valid_color(c) for c in colors])
+
+        # points of interest matching a chosen or excluded colour are skipped, the
+        # same as for redmean
+        n_candidates = []
+        distinctipy.get_colors(
+            3,
+            n_attempts=0,
+            rng=8,
+            metric=metric,
+            on_color=lambda stats: n_candidates.append(stats["candidates"]),
+        )
+        assert n_candidates == [31, 30, 29]
+
+        palette = distinctipy.PaletteBuilder(n_attempts=200, rng=8, metric=metric)
+        assert palette.add(6) == distinctipy.get_colors(
+            6, n_attempts=200, rng=8, metric=metric, incremental=True
+        )
+
+    with pytest.raises(ValueError):
+        distinctipy.get_colors(2, metric="euclidean")
+
+
+def test_color_distance_matrix():
+    """Assert color_distance_matrix matches color_distance in chunks and reductions"""
+    colors = distinctipy.get_colors(30, n_attempts=50, rng=9)
+    others = distinctipy.get_colors(20, n_attempts=50, rng=10)
+
+    distances = distinctipy.color_distance_matrix(colors, others, chunk_size=64)
+    assert distances.shape == (30, 20)
+    for i in [0, 13, 29]:
+        for j in [0, 7, 19]:
+            assert np.isclose(
+                distances[i, j], distinctipy.color_distance(colors[i], others[j])
+            )
+
+    nearest, index = distinctipy.color_distance_matrix(
+        colors, chunk_size=64, reduce="nearest", dtype=np.float32
+    )
+    within = distinctipy.color_distance_matrix(colors, metric="cie76")
+    assert nearest.dtype == np.float32
+    full = distinctipy.color_distance_matrix(colors)
+    np.fill_diagonal(full, np.inf)
+    assert (index == full.argmin(axis=1)).all()
+    assert np.allclose(nearest, full.min(axis=1))
+    assert np.allclose(np.diag(within), 0)
+
+
+def test_get_colors_large():
+    """Assert get_colors_large does farthest-point sampling without repeating colours"""
+    from distinctipy.distinctipy import _candidate_lattice, _simulate_colors
+
+    exclude = [distinctipy.WHITE, distinctipy.BLACK]
+    colors = distinctipy.get_colors_large(
+        200, grid_size=12, pastel_factor=0.2, colorblind_type="Deuteranomaly"
+    )
+    assert colors.shape == (200, 3)
+    assert len(np.unique(colors, axis=0)) == 200
+
+    # each colour is the candidate farthest from the excluded and previous colours
+    candidates, compare = _candidate_lattice(0.2, "Deuteranomaly", 12)
+    nearest = distinctipy.color_distance_matrix(
+        candidates, exclude, colorblind_type="Deuteranomaly"
+    ).min(axis=1)
+    for color in colors:
+        idx = np.flatnonzero((candidates == color).all(axis=1))[0]
+        assert np.isclose(nearest[idx], nearest.max())
+        simulated = _simulate_colors(color[np.newaxis], "Deuteranomaly")
+        nearest = np.minimum(
+            nearest, distinctipy.color_distance_matrix(compare, simulated)[:, 0]
+        )
+
+    # the lattice corners include the excluded black and white
+    colors = distinctipy.get_colors_large(62, grid_size=4)
+    assert len(np.unique(colors, axis=0)) == 62
+    assert not (colors == 0).all(axis=1).any()
+    assert not (colors == 1).all(axis=1).any()
+    with pytest.raises(ValueError):
+        distinctipy.get_colors_large(63, grid_size=4)
+    with pytest.raises(ValueError):
+        distinctipy.get_colors_large(100, grid_size=4)
+
+
+def test_hex_and_uint8_conversions():
+    """Assert the vectorised converters round trip and match the scalar helpers"""
+    assert distinctipy.rgb_to_hex([(0, 0, 0), (1, 1, 1), (0.2, 0.4, 0.6)]) == [
+        "#000000",
+        "#ffffff",
+        "#336699",
+    ]
+
+    colors = np.random.default_rng(11).random((500, 3))
+    # values exactly halfway between two integers round to even, like matplotlib
+    colors[:255] = np.repeat((np.arange(255) + 0.5)[:, np.newaxis] / 255, 3, axis=1)
+
+    hex_colors = distinctipy.rgb_to_hex(colors)
+    assert hex_colors == [
+        "#" + "".join(format(round(v * 255), "02x") for v in c) for c in colors
+    ]
+    assert distinctipy.get_hex(tuple(colors[3])) == hex_colors[3]
+    assert distinctipy.get_hex((0.2, 0.4, 0.6, 0.5)) == "#336699"
+
+    values = distinctipy.rgb_to_uint8(colors)
+    assert values.dtype == np.uint8
+    assert [tuple(v) for v in values.tolist()] == [
+        distinctipy.get_rgb256(c) for c in colors
+    ]
+
+    assert np.array_equal(distinctipy.hex_to_rgb(hex_colors), values / 255)
+    assert np.array_equal(distinctipy.uint8_to_rgb(values), values / 255)
+    assert np.array_equal(distinctipy.hex_to_rgb("00ff80"), [0, 1, 128 / 255])
+
+    assert distinctipy.rgb_to_hex([]) == []
+
+    with pytest.raises(ValueError):
+        distinctipy.rgb_to_hex([(1.5, 0, 0)])
+    with pytest.raises(ValueError):
+        distinctipy.hex_to_rgb(["#12345"])
+    for values in [np.array([256, 0, 0]), np.array([-1, 0, 0]), [300, 0, 0]]:
+        with pytest.raises(ValueError):
+            distinctipy.uint8_to_rgb(values)
+
+
+def test_get_hex_matplotlib_specs():
+    """Assert get_hex passes colours that aren't (r,g,b) tuples to matplotlib"""
+    pytest.importorskip("matplotlib")
+
+    assert distinctipy.get_hex("red") == "#ff0000"
+    assert distinctipy.get_hex("0.5") == "#808080"
+
+
+def test_colorize_labels(tmp_path):
+    """Assert colorize_labels matches indexing the palette, for dense and sparse ids"""
+    palette = distinctipy.get_colors(5, n_attempts=50, rng=12)
+    palette_uint8 = distinctipy.rgb_to_uint8(palette)
+    labels = np.random.default_rng(13).integers(0, 5, size=(7, 6, 4))
+
+    colored = distinctipy.colorize_labels(labels, palette, chunk=10)
+    assert colored.shape == (7, 6, 4, 3)
+    assert colored.dtype == np.uint8
+    assert np.array_equal(colored, palette_uint8[labels])
+
+    # sparse label ids, looked up with a dense table and by binary search, written
+    # to a memory-mapped output
+    for label_ids in [[3, 10, 17, 24, 31], [0, 10, 10**12, 2, 7]]:
+        sparse = np.asarray(label_ids)[labels]
+        out = np.lib.format.open_memmap(
+            str(tmp_path / "colored.npy"), mode="w+", dtype=np.uint8, shape=(7, 6, 4, 3)
+        )
+        result = distinctipy.colorize_labels(
+            sparse, palette_uint8, out=out, chunk=30, label_ids=label_ids
+        )
+        assert result is out
+        assert np.array_equal(out, colored)
+
+    # small signed labels with negative ids mustn't overflow when offset
+    signed_palette = distinctipy.get_colors(201, n_attempts=10, rng=14)
+    signed = np.arange(-100, 101, dtype=np.int8)
+    assert np.array_equal(
+        distinctipy.colorize_labels(signed, signed_palette, label_ids=range(-100, 101)),
+        distinctipy.rgb_to_uint8(signed_palette),
+    )
+
+    with pytest.raises(ValueError):
+        distinctipy.colorize_labels(labels + 1, palette)
+    with pytest.raises(ValueError):
+        distinctipy.colorize_labels(labels, palette, out=np.empty((7, 6, 4, 3)))
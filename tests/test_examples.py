@@ -44,3 +44,14 @@ def test_simulate_colors():
     require_modules(["matplotlib"])
     colors = distinctipy.get_colors(10)
     distinctipy.colorblind.simulate_colors(colors, show=False)
+
+
+def test_simulate_image():
+    require_modules(["matplotlib"])
+    import os
+
+    img_path = os.path.join(
+        os.path.dirname(distinctipy.__file__), "datasets", "test.png"
+    )
+    filtered = distinctipy.colorblind.simulate_image(img_path, "Tritanopia", show=False)
+    assert filtered.ndim == 3 and filtered.shape[2] == 3
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import distinctipy
+
+
+def _modules_after(code):
+    """Names of the modules loaded after running code in a fresh interpreter."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"]
+    )
+    return set(output.decode().split())
+
+
+def test_import_is_lazy():
+    modules = _modules_after("import distinctipy")
+    assert "distinctipy" in modules
+    for name in [
+        "numpy",
+        "importlib.metadata",
+        "distinctipy.distinctipy",
+        "distinctipy.colorblind",
+        "distinctipy.colorsets",
+        "distinctipy.examples",
+    ]:
+        assert name not in modules
+
+    modules = _modules_after("from distinctipy import get_colors")
+    assert "distinctipy.distinctipy" in modules
+    assert "distinctipy.colorsets" not in modules
+    assert "distinctipy.examples" not in modules
+
+
+def test_public_api():
+    for name in distinctipy.__all__:
+        assert getattr(distinctipy, name) is not None
+    assert distinctipy.get_colors is distinctipy.distinctipy.get_colors
+    assert isinstance(distinctipy.__version__, str)
+    assert "get_colors" in dir(distinctipy)